@@ -2,18 +2,109 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS, CONF_SENSOR_MODE, SENSOR_MODE_ARRAY, SENSOR_MODE_LEGACY
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    DEFAULT_NAME,
+    DEFAULT_LANG,
+    CONF_LANG,
+    CONF_BILINGUAL,
+    CONF_SENSOR_MODE,
+    CONF_TEST_MODE,
+    CONF_FIXTURE_PATH,
+    CONF_FIXTURE_SPEED,
+    DEFAULT_FIXTURE_SPEED,
+    CONF_VARSOM,
+    CONF_COUNTY,
+    CONF_COUNTY_MODE,
+    CONF_POINT_FILTER,
+    CONF_LOCAL_MAPS,
+    CONF_REFRESH_MIN_INTERVAL,
+    DEFAULT_REFRESH_MIN_INTERVAL,
+    CONF_TRACKER,
+    CONF_TRACKER_PRECISION,
+    DEFAULT_TRACKER_PRECISION,
+    CONF_SEVERITY_THRESHOLDS,
+    CONF_EVENT_THRESHOLDS,
+    SENSOR_MODE_ARRAY,
+    SENSOR_MODE_LEGACY,
+    SIGNAL_ENTRY_UNLOADED,
+)
+from .coordinator import MetAlertsCoordinator
+from .sensor import build_sensors
+from .services import async_register_services
+from .thresholds import threshold_keys
+from .websocket import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
+# Options that are applied to the running entry without a reload
+HOT_OPTIONS = {CONF_SENSOR_MODE, CONF_TEST_MODE, CONF_REFRESH_MIN_INTERVAL}
+
+# Values used for options an entry has not saved, so saving a default is not a change
+OPTION_DEFAULTS = {
+    CONF_SENSOR_MODE: SENSOR_MODE_LEGACY,
+    CONF_TEST_MODE: False,
+    CONF_FIXTURE_SPEED: DEFAULT_FIXTURE_SPEED,
+    CONF_VARSOM: False,
+    CONF_COUNTY_MODE: False,
+    CONF_POINT_FILTER: False,
+    CONF_LOCAL_MAPS: False,
+    CONF_REFRESH_MIN_INTERVAL: DEFAULT_REFRESH_MIN_INTERVAL,
+    CONF_TRACKER_PRECISION: DEFAULT_TRACKER_PRECISION,
+    CONF_SEVERITY_THRESHOLDS: [],
+    CONF_EVENT_THRESHOLDS: [],
+    CONF_BILINGUAL: False,
+}
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Met Alerts integration."""
+    async_register_websocket_commands(hass)
+    async_register_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Met Alerts from a config entry."""
+    coordinator = MetAlertsCoordinator(
+        hass,
+        latitude=entry.data.get(CONF_LATITUDE),
+        longitude=entry.data.get(CONF_LONGITUDE),
+        lang=entry.data.get(CONF_LANG, DEFAULT_LANG),
+        test_mode=entry.options.get(CONF_TEST_MODE, False),
+        fixture_path=entry.options.get(CONF_FIXTURE_PATH) or None,
+        fixture_speed=entry.options.get(CONF_FIXTURE_SPEED, DEFAULT_FIXTURE_SPEED),
+        varsom=entry.options.get(CONF_VARSOM, False),
+        county=entry.options.get(CONF_COUNTY) or None,
+        local_maps=entry.options.get(CONF_LOCAL_MAPS, False),
+        severity_thresholds=entry.options.get(CONF_SEVERITY_THRESHOLDS, []),
+        event_thresholds=entry.options.get(CONF_EVENT_THRESHOLDS, []),
+        tracker=entry.options.get(CONF_TRACKER) or None,
+        tracker_precision=entry.options.get(CONF_TRACKER_PRECISION, DEFAULT_TRACKER_PRECISION),
+        county_mode=entry.options.get(CONF_COUNTY_MODE, False),
+        point_filter=entry.options.get(CONF_POINT_FILTER, False),
+        bilingual=entry.options.get(CONF_BILINGUAL, False),
+        refresh_min_interval=entry.options.get(CONF_REFRESH_MIN_INTERVAL, DEFAULT_REFRESH_MIN_INTERVAL),
+    )
+    coordinator.entry_config = (dict(entry.data), dict(entry.options))
+    if coordinator.tracker:
+        entry.async_on_unload(coordinator.async_start_tracking())
+    if coordinator.county_mode:
+        entry.async_on_unload(coordinator.async_start_county_feeds())
+    await coordinator.async_config_entry_first_refresh()
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Forward the setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -29,34 +120,94 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].pop(entry.entry_id).async_release()
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
 
     return unload_ok
 
 
-async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update and clean up old entities when switching modes."""
+def _other_mode_sensors(hass: HomeAssistant, entry: ConfigEntry, sensor_mode: str) -> list[str]:
+    """Return the sensor entities that belong to the other sensor mode."""
     entity_registry = er.async_get(hass)
-    
-    # Get current sensor mode
-    sensor_mode = entry.options.get(CONF_SENSOR_MODE, SENSOR_MODE_LEGACY)
-    
+
     # Get all entities for this config entry
     entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
-    
-    # Remove incompatible entities based on new mode
+
+    # Find incompatible entities based on new mode
+    stale = []
     for entity in entities:
+        if entity.domain != "sensor" or not entity.unique_id:
+            continue
         if sensor_mode == SENSOR_MODE_ARRAY:
             # In array mode, remove legacy sensors (_2, _3, _4, and base without _array suffix)
-            if entity.unique_id and not entity.unique_id.endswith("_array"):
+            if not entity.unique_id.endswith("_array"):
                 _LOGGER.info(f"Removing legacy sensor entity {entity.entity_id} (switching to array mode)")
-                entity_registry.async_remove(entity.entity_id)
+                stale.append(entity.entity_id)
         else:
             # In legacy mode, remove array sensor
-            if entity.unique_id and entity.unique_id.endswith("_array"):
+            if entity.unique_id.endswith("_array"):
                 _LOGGER.info(f"Removing array sensor entity {entity.entity_id} (switching to legacy mode)")
-                entity_registry.async_remove(entity.entity_id)
-    
-    # Reload the integration to create new entities
-    await hass.config_entries.async_reload(entry.entry_id)
+                stale.append(entity.entity_id)
+    return stale
+
+
+def _stale_threshold_sensors(hass: HomeAssistant, entry: ConfigEntry) -> list[str]:
+    """Return the binary sensors of thresholds that are no longer configured."""
+    keys = threshold_keys(
+        entry.options.get(CONF_SEVERITY_THRESHOLDS, []),
+        entry.options.get(CONF_EVENT_THRESHOLDS, []),
+    )
+    wanted = {f"{entry.entry_id}_{key}" for key in keys}
+    return [
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if entity.domain == "binary_sensor" and entity.unique_id not in wanted
+    ]
+
+
+async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update.
+
+    Display-only options are applied to the running coordinator and its
+    entities; any other change reloads the entry.
+    """
+    entity_registry = er.async_get(hass)
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    old_data, old_options = coordinator.entry_config
+    old_options = {**OPTION_DEFAULTS, **old_options}
+    new_options = {**OPTION_DEFAULTS, **entry.options}
+    changed = {
+        key for key in old_options.keys() | new_options.keys()
+        if old_options.get(key) != new_options.get(key)
+    }
+    sensor_mode = entry.options.get(CONF_SENSOR_MODE, SENSOR_MODE_LEGACY)
+
+    if old_data != dict(entry.data) or not changed <= HOT_OPTIONS:
+        for entity_id in _other_mode_sensors(hass, entry, sensor_mode) + _stale_threshold_sensors(hass, entry):
+            entity_registry.async_remove(entity_id)
+        # Reload the integration to create new entities
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator.entry_config = (dict(entry.data), dict(entry.options))
+    coordinator.refresh_min_interval = entry.options.get(CONF_REFRESH_MIN_INTERVAL, DEFAULT_REFRESH_MIN_INTERVAL)
+
+    if CONF_TEST_MODE in changed:
+        await coordinator.async_set_test_mode(entry.options.get(CONF_TEST_MODE, False))
 
+    if CONF_SENSOR_MODE in changed:
+        platform = next(
+            platform
+            for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+            if platform.domain == "sensor"
+            and platform.config_entry is not None
+            and platform.config_entry.entry_id == entry.entry_id
+        )
+        # Drop the old sensors' states and registry entries before adding the new
+        # sensors; a restored state or registry entry would keep the entity id taken
+        for entity_id in _other_mode_sensors(hass, entry, sensor_mode):
+            if (entity := platform.entities.get(entity_id)) is not None:
+                await entity.async_remove(force_remove=True)
+            entity_registry.async_remove(entity_id)
+        name = entry.data.get(CONF_NAME, DEFAULT_NAME)
+        await platform.async_add_entities(build_sensors(coordinator, name, entry.entry_id, sensor_mode))
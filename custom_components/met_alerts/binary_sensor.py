@@ -0,0 +1,56 @@
+"""Met Alerts binary sensor platform: severity and event type thresholds."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, DEFAULT_NAME
+from .coordinator import MetAlertsCoordinator
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the threshold binary sensors from a config entry."""
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
+    async_add_entities(
+        MetAlertsThresholdSensor(coordinator, name, entry.entry_id, key)
+        for key in coordinator.thresholds
+    )
+
+
+class MetAlertsThresholdSensor(CoordinatorEntity, BinarySensorEntity):
+    """On while any alert meets a severity or event type threshold.
+
+    The coordinator evaluates all thresholds once per refresh; the entity
+    only writes its state when the value or availability changes.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.SAFETY
+
+    def __init__(self, coordinator: MetAlertsCoordinator, name: str, entry_id: str, key: str):
+        super().__init__(coordinator)
+        self._key = key
+        kind, value = key.split("_", 1)
+        self._attr_name = f"{name} {value} or worse" if kind == "severity" else f"{name} {value} alert"
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_has_entity_name = False
+        self._attr_is_on = coordinator.thresholds.get(key, False)
+        self._was_available = coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        is_on = self.coordinator.thresholds.get(self._key, False)
+        available = self.available
+        if is_on == self._attr_is_on and available == self._was_available:
+            return
+        self._attr_is_on = is_on
+        self._was_available = available
+        self.async_write_ha_state()
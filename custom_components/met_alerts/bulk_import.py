@@ -0,0 +1,160 @@
+"""Bulk import of many locations through the met_alerts.import_locations service."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import logging
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+import yaml
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
+
+from .config_flow import validate_coordinates
+from .const import (
+    DOMAIN,
+    DEFAULT_LANG,
+    CONF_LANG,
+    CONF_SENSOR_MODE,
+    SENSOR_MODE_LEGACY,
+    SENSOR_MODE_ARRAY,
+    BULK_IMPORT_WORKERS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_IMPORT_LOCATIONS = "import_locations"
+ATTR_LOCATIONS = "locations"
+
+LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_LATITUDE): cv.latitude,
+        vol.Required(CONF_LONGITUDE): cv.longitude,
+        vol.Optional(CONF_LANG): vol.In(["no", "en"]),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_LOCATIONS): vol.Any(cv.string, [dict]),
+        vol.Optional(CONF_LANG, default=DEFAULT_LANG): vol.In(["no", "en"]),
+        vol.Optional(CONF_SENSOR_MODE, default=SENSOR_MODE_LEGACY): vol.In([SENSOR_MODE_LEGACY, SENSOR_MODE_ARRAY]),
+    }
+)
+
+
+def parse_locations(locations: str | list[dict]) -> list[Any]:
+    """Return location rows from a YAML list of mappings or CSV text.
+
+    CSV rows are ``name,latitude,longitude[,lang]``, with an optional header.
+    """
+    if isinstance(locations, list):
+        return locations
+    try:
+        parsed = yaml.safe_load(locations)
+    except yaml.YAMLError:
+        parsed = None
+    if isinstance(parsed, list):
+        return parsed
+    rows = []
+    for row in csv.reader(io.StringIO(locations)):
+        row = [value.strip() for value in row]
+        if not any(row):
+            continue
+        if not rows and row[0].lower() == CONF_NAME:
+            continue
+        rows.append(dict(zip((CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE, CONF_LANG), row)))
+    return rows
+
+
+async def async_import_locations(
+    hass: HomeAssistant, rows: list[Any], lang: str, sensor_mode: str
+) -> dict[str, list]:
+    """Validate locations concurrently, then create entries for the new ones.
+
+    Locations already configured, or repeated in the input, are skipped
+    before any request is made.
+    """
+    configured = {entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)}
+    result: dict[str, list] = {"created": [], "skipped": [], "failed": []}
+    pending = []
+    for row in rows:
+        try:
+            location = LOCATION_SCHEMA(row)
+        except vol.Invalid as err:
+            result["failed"].append({"location": str(row), "error": str(err)})
+            continue
+        location.setdefault(CONF_LANG, lang)
+        unique_id = f"{location[CONF_LATITUDE]}_{location[CONF_LONGITUDE]}"
+        if unique_id in configured:
+            result["skipped"].append(location[CONF_NAME])
+            continue
+        configured.add(unique_id)
+        pending.append(location)
+
+    semaphore = asyncio.Semaphore(BULK_IMPORT_WORKERS)
+
+    async def validate(session: aiohttp.ClientSession, location: dict) -> bool:
+        async with semaphore:
+            try:
+                await validate_coordinates(
+                    hass, location[CONF_LATITUDE], location[CONF_LONGITUDE], location[CONF_LANG], session
+                )
+            except ValueError as err:
+                result["failed"].append({"location": location[CONF_NAME], "error": str(err)})
+                return False
+        return True
+
+    async with aiohttp.ClientSession() as session:
+        valid = await asyncio.gather(*(validate(session, location) for location in pending))
+
+    # Validated payloads are handed off, so setting up these entries makes no new requests
+    locations = [location for location, ok in zip(pending, valid) if ok]
+    flows = await asyncio.gather(
+        *(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data={**location, CONF_SENSOR_MODE: sensor_mode},
+            )
+            for location in locations
+        )
+    )
+    for location, flow in zip(locations, flows):
+        if flow.get("type") == FlowResultType.CREATE_ENTRY:
+            result["created"].append(location[CONF_NAME])
+        else:
+            result["skipped"].append(location[CONF_NAME])
+    _LOGGER.info(
+        "Imported %d location(s), skipped %d, failed %d",
+        len(result["created"]),
+        len(result["skipped"]),
+        len(result["failed"]),
+    )
+    return result
+
+
+@callback
+def async_register_import_service(hass: HomeAssistant) -> None:
+    """Register the bulk import service."""
+
+    async def handle_import(call: ServiceCall) -> ServiceResponse:
+        rows = parse_locations(call.data[ATTR_LOCATIONS])
+        return await async_import_locations(hass, rows, call.data[CONF_LANG], call.data[CONF_SENSOR_MODE])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_LOCATIONS,
+        handle_import,
+        schema=SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
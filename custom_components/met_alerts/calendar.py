@@ -0,0 +1,64 @@
+"""Met Alerts calendar platform: one event per alert validity window."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DEFAULT_NAME
+from .coordinator import MetAlertsCoordinator
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Met Alerts calendar from a config entry."""
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
+    async_add_entities([MetAlertsCalendar(coordinator, name, entry.entry_id)])
+
+
+class MetAlertsCalendar(CoordinatorEntity, CalendarEntity):
+    """Calendar of active and upcoming alerts.
+
+    Events are served from the coordinator's interval index, so range
+    queries from the calendar panel and triggers do not parse any alerts.
+    """
+
+    def __init__(self, coordinator: MetAlertsCoordinator, name: str, entry_id: str):
+        super().__init__(coordinator)
+        self._attr_name = f"{name} calendar"
+        self._attr_unique_id = f"{entry_id}_calendar"
+        self._attr_has_entity_name = False
+
+    def _event(self, key: str) -> CalendarEvent:
+        alert = self.coordinator.alerts[key]
+        start, end = self.coordinator.interval_index.window(key)
+        return CalendarEvent(
+            start=start,
+            end=end,
+            summary=alert["title"] or alert["event_awareness_name"],
+            description=alert["description"],
+            location=", ".join(alert["areas"]) or None,
+            uid=key,
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the active alert, or the next one to start."""
+        key = self.coordinator.interval_index.current_or_next(dt_util.now())
+        return self._event(key) if key is not None else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return alerts whose window overlaps the requested range."""
+        return [self._event(key) for key in self.coordinator.interval_index.overlapping(start_date, end_date)]
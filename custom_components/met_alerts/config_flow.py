@@ -1,5 +1,4 @@
 """Config flow for Met Alerts integration."""
-import asyncio
 import logging
 
 import aiohttp
@@ -15,38 +14,62 @@ from .const import (
     DEFAULT_NAME,
     DEFAULT_LANG,
     CONF_LANG,
+    CONF_BILINGUAL,
     CONF_SENSOR_MODE,
     SENSOR_MODE_LEGACY,
     SENSOR_MODE_ARRAY,
     CONF_TEST_MODE,
+    CONF_FIXTURE_PATH,
+    CONF_FIXTURE_SPEED,
+    DEFAULT_FIXTURE_SPEED,
+    CONF_VARSOM,
+    CONF_COUNTY,
+    CONF_COUNTY_MODE,
+    CONF_POINT_FILTER,
+    COUNTIES,
+    CONF_LOCAL_MAPS,
+    CONF_REFRESH_MIN_INTERVAL,
+    DEFAULT_REFRESH_MIN_INTERVAL,
+    CONF_TRACKER,
+    CONF_TRACKER_PRECISION,
+    DEFAULT_TRACKER_PRECISION,
+    CONF_SEVERITY_THRESHOLDS,
+    CONF_EVENT_THRESHOLDS,
+    SEVERITY_THRESHOLDS,
 )
+from .core import MetAlertsError, async_fetch_alerts
+from .handoff import store_validated_payload
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def validate_coordinates(hass: HomeAssistant, latitude: float, longitude: float, lang: str):
-    """Validate that the coordinates work with the API."""
-    url = f"https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0/current.json?lat={latitude}&lon={longitude}&lang={lang}"
-    
+async def validate_coordinates(
+    hass: HomeAssistant,
+    latitude: float,
+    longitude: float,
+    lang: str,
+    session: aiohttp.ClientSession | None = None,
+):
+    """Validate that the coordinates work with the API.
+
+    The parsed response is handed off to the coordinator so that setting up
+    the entry does not fetch the same URL again. Pass ``session`` to share
+    one session between many validations.
+    """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with asyncio.timeout(10):
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'application/json' not in content_type:
-                        raise ValueError(f"Unexpected content type: {content_type}")
-                    
-                    # Try to parse JSON
-                    await response.json()
-                    return True
-    except aiohttp.ClientError as err:
+        if session is not None:
+            payload = await async_fetch_alerts(session, latitude, longitude, lang)
+        else:
+            async with aiohttp.ClientSession() as session:
+                payload = await async_fetch_alerts(session, latitude, longitude, lang)
+    except MetAlertsError as err:
         raise ValueError(f"Cannot connect to API: {err}")
     except Exception as err:
         raise ValueError(f"Unexpected error: {err}")
 
+    store_validated_payload(hass, latitude, longitude, lang, payload)
+    return True
+
 
 class MetAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Met Alerts."""
@@ -58,6 +81,12 @@ class MetAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
+            # Create a unique ID based on coordinates
+            await self.async_set_unique_id(
+                f"{user_input[CONF_LATITUDE]}_{user_input[CONF_LONGITUDE]}"
+            )
+            self._abort_if_unique_id_configured()
+
             try:
                 # Validate the coordinates work
                 await validate_coordinates(
@@ -67,12 +96,6 @@ class MetAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     user_input.get(CONF_LANG, DEFAULT_LANG),
                 )
 
-                # Create a unique ID based on coordinates
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_LATITUDE]}_{user_input[CONF_LONGITUDE]}"
-                )
-                self._abort_if_unique_id_configured()
-
                 # Split config data and options data
                 config_data = {
                     CONF_NAME: user_input[CONF_NAME],
@@ -122,6 +145,21 @@ class MetAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_import(self, import_data):
+        """Create an entry for a location validated by the bulk import service."""
+        await self.async_set_unique_id(f"{import_data[CONF_LATITUDE]}_{import_data[CONF_LONGITUDE]}")
+        self._abort_if_unique_id_configured()
+        config_data = {
+            CONF_NAME: import_data[CONF_NAME],
+            CONF_LATITUDE: import_data[CONF_LATITUDE],
+            CONF_LONGITUDE: import_data[CONF_LONGITUDE],
+            CONF_LANG: import_data.get(CONF_LANG, DEFAULT_LANG),
+        }
+        options_data = {}
+        if CONF_SENSOR_MODE in import_data:
+            options_data[CONF_SENSOR_MODE] = import_data[CONF_SENSOR_MODE]
+        return self.async_create_entry(title=import_data[CONF_NAME], data=config_data, options=options_data)
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -138,13 +176,20 @@ class MetAlertsOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             try:
-                # Validate the new coordinates if changed
-                await validate_coordinates(
-                    self.hass,
-                    user_input[CONF_LATITUDE],
-                    user_input[CONF_LONGITUDE],
-                    user_input.get(CONF_LANG, DEFAULT_LANG),
-                )
+                # Validate the new coordinates if changed. Display-only changes
+                # (name, sensor mode, test mode) need no round trip to the API.
+                current = self.config_entry.data
+                if (
+                    user_input[CONF_LATITUDE] != current.get(CONF_LATITUDE)
+                    or user_input[CONF_LONGITUDE] != current.get(CONF_LONGITUDE)
+                    or user_input.get(CONF_LANG, DEFAULT_LANG) != current.get(CONF_LANG, DEFAULT_LANG)
+                ):
+                    await validate_coordinates(
+                        self.hass,
+                        user_input[CONF_LATITUDE],
+                        user_input[CONF_LONGITUDE],
+                        user_input.get(CONF_LANG, DEFAULT_LANG),
+                    )
 
                 # Update config entry data
                 self.hass.config_entries.async_update_entry(
@@ -156,12 +201,35 @@ class MetAlertsOptionsFlow(config_entries.OptionsFlow):
                         CONF_LANG: user_input.get(CONF_LANG, DEFAULT_LANG),
                     },
                 )
-                # Return options data (sensor_mode and test_mode)
+                # Return options data (sensor_mode, test_mode and fixture replay)
                 options_data = {}
                 if CONF_SENSOR_MODE in user_input:
                     options_data[CONF_SENSOR_MODE] = user_input[CONF_SENSOR_MODE]
                 if CONF_TEST_MODE in user_input:
                     options_data[CONF_TEST_MODE] = user_input[CONF_TEST_MODE]
+                if CONF_BILINGUAL in user_input:
+                    options_data[CONF_BILINGUAL] = user_input[CONF_BILINGUAL]
+                if CONF_VARSOM in user_input:
+                    options_data[CONF_VARSOM] = user_input[CONF_VARSOM]
+                if CONF_LOCAL_MAPS in user_input:
+                    options_data[CONF_LOCAL_MAPS] = user_input[CONF_LOCAL_MAPS]
+                if CONF_REFRESH_MIN_INTERVAL in user_input:
+                    options_data[CONF_REFRESH_MIN_INTERVAL] = user_input[CONF_REFRESH_MIN_INTERVAL]
+                if user_input.get(CONF_TRACKER):
+                    options_data[CONF_TRACKER] = user_input[CONF_TRACKER]
+                    options_data[CONF_TRACKER_PRECISION] = user_input.get(CONF_TRACKER_PRECISION, DEFAULT_TRACKER_PRECISION)
+                if user_input.get(CONF_SEVERITY_THRESHOLDS):
+                    options_data[CONF_SEVERITY_THRESHOLDS] = user_input[CONF_SEVERITY_THRESHOLDS]
+                events = [event.strip() for event in user_input.get(CONF_EVENT_THRESHOLDS, "").split(",")]
+                if any(events):
+                    options_data[CONF_EVENT_THRESHOLDS] = list(dict.fromkeys(event for event in events if event))
+                if user_input.get(CONF_COUNTY):
+                    options_data[CONF_COUNTY] = user_input[CONF_COUNTY]
+                    options_data[CONF_COUNTY_MODE] = user_input.get(CONF_COUNTY_MODE, False)
+                    options_data[CONF_POINT_FILTER] = user_input.get(CONF_POINT_FILTER, False)
+                if user_input.get(CONF_FIXTURE_PATH):
+                    options_data[CONF_FIXTURE_PATH] = user_input[CONF_FIXTURE_PATH]
+                    options_data[CONF_FIXTURE_SPEED] = user_input.get(CONF_FIXTURE_SPEED, DEFAULT_FIXTURE_SPEED)
                 return self.async_create_entry(title="", data=options_data)
             except ValueError as err:
                 _LOGGER.error("Validation failed: %s", err)
@@ -179,6 +247,24 @@ class MetAlertsOptionsFlow(config_entries.OptionsFlow):
         current_test_mode = self.config_entry.options.get(
             CONF_TEST_MODE, self.config_entry.data.get(CONF_TEST_MODE, False)
         )
+        current_bilingual = self.config_entry.options.get(CONF_BILINGUAL, False)
+        current_varsom = self.config_entry.options.get(CONF_VARSOM, False)
+        current_county = self.config_entry.options.get(CONF_COUNTY, "")
+        current_county_mode = self.config_entry.options.get(CONF_COUNTY_MODE, False)
+        current_point_filter = self.config_entry.options.get(CONF_POINT_FILTER, False)
+        current_local_maps = self.config_entry.options.get(CONF_LOCAL_MAPS, False)
+        current_refresh_interval = self.config_entry.options.get(
+            CONF_REFRESH_MIN_INTERVAL, DEFAULT_REFRESH_MIN_INTERVAL
+        )
+        current_tracker = self.config_entry.options.get(CONF_TRACKER, "")
+        current_precision = self.config_entry.options.get(CONF_TRACKER_PRECISION, DEFAULT_TRACKER_PRECISION)
+        trackers = {
+            state.entity_id: state.name for state in self.hass.states.async_all(["person", "device_tracker"])
+        }
+        current_severities = self.config_entry.options.get(CONF_SEVERITY_THRESHOLDS, [])
+        current_events = ",".join(self.config_entry.options.get(CONF_EVENT_THRESHOLDS, []))
+        current_fixture_path = self.config_entry.options.get(CONF_FIXTURE_PATH, "")
+        current_fixture_speed = self.config_entry.options.get(CONF_FIXTURE_SPEED, DEFAULT_FIXTURE_SPEED)
 
         data_schema = vol.Schema(
             {
@@ -188,6 +274,27 @@ class MetAlertsOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(CONF_LANG, default=current_lang): vol.In(["no", "en"]),
                 vol.Optional(CONF_SENSOR_MODE, default=current_mode): vol.In([SENSOR_MODE_LEGACY, SENSOR_MODE_ARRAY]),
                 vol.Optional(CONF_TEST_MODE, default=current_test_mode): cv.boolean,
+                vol.Optional(CONF_BILINGUAL, default=current_bilingual): cv.boolean,
+                vol.Optional(CONF_VARSOM, default=current_varsom): cv.boolean,
+                vol.Optional(CONF_COUNTY, default=current_county): vol.In({"": "-", **COUNTIES}),
+                vol.Optional(CONF_COUNTY_MODE, default=current_county_mode): cv.boolean,
+                vol.Optional(CONF_POINT_FILTER, default=current_point_filter): cv.boolean,
+                vol.Optional(CONF_LOCAL_MAPS, default=current_local_maps): cv.boolean,
+                vol.Optional(CONF_REFRESH_MIN_INTERVAL, default=current_refresh_interval): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=3600)
+                ),
+                vol.Optional(CONF_TRACKER, default=current_tracker): vol.In({"": "-", **trackers}),
+                vol.Optional(CONF_TRACKER_PRECISION, default=current_precision): vol.All(
+                    vol.Coerce(int), vol.Range(min=3, max=7)
+                ),
+                vol.Optional(CONF_SEVERITY_THRESHOLDS, default=current_severities): cv.multi_select(
+                    {color: color.capitalize() for color in SEVERITY_THRESHOLDS}
+                ),
+                vol.Optional(CONF_EVENT_THRESHOLDS, default=current_events): cv.string,
+                vol.Optional(CONF_FIXTURE_PATH, default=current_fixture_path): cv.string,
+                vol.Optional(CONF_FIXTURE_SPEED, default=current_fixture_speed): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=3600)
+                ),
             }
         )
 
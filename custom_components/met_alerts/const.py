@@ -8,6 +8,48 @@ CONF_SENSOR_MODE = "sensor_mode"
 SENSOR_MODE_LEGACY = "legacy"
 SENSOR_MODE_ARRAY = "array"
 CONF_TEST_MODE = "test_mode"
+CONF_FIXTURE_PATH = "fixture_path"
+CONF_FIXTURE_SPEED = "fixture_speed"
+DEFAULT_FIXTURE_SPEED = 1.0
+CONF_VARSOM = "varsom"
+CONF_COUNTY = "county"
+CONF_COUNTY_MODE = "county_mode"
+CONF_POINT_FILTER = "point_filter"
+
+CONF_LOCAL_MAPS = "local_maps"
+CONF_REFRESH_MIN_INTERVAL = "refresh_min_interval"
+# Seconds between refreshes requested through the met_alerts.refresh service
+DEFAULT_REFRESH_MIN_INTERVAL = 60
+CONF_TRACKER = "tracker"
+CONF_TRACKER_PRECISION = "tracker_precision"
+# Geohash length used to snap tracker positions; 5 gives cells of about 5x5 km
+DEFAULT_TRACKER_PRECISION = 5
+CONF_SEVERITY_THRESHOLDS = "severity_thresholds"
+CONF_EVENT_THRESHOLDS = "event_thresholds"
+# Rank of the awareness color each severity threshold binary sensor needs at least
+SEVERITY_THRESHOLDS = {"yellow": 1, "orange": 2, "red": 3}
+# Alert map image cache: total size on disk, and lifetime for alerts without an end time
+MAP_CACHE_MAX_BYTES = 20 * 1024 * 1024
+MAP_CACHE_DEFAULT_TTL = 24 * 3600
+
+# Norwegian county numbers as used by the MetAlerts and Varsom APIs
+COUNTIES = {
+    "03": "Oslo",
+    "11": "Rogaland",
+    "15": "Møre og Romsdal",
+    "18": "Nordland",
+    "31": "Østfold",
+    "32": "Akershus",
+    "33": "Buskerud",
+    "34": "Innlandet",
+    "39": "Vestfold",
+    "40": "Telemark",
+    "42": "Agder",
+    "46": "Vestland",
+    "50": "Trøndelag",
+    "55": "Troms",
+    "56": "Finnmark",
+}
 
 ICON_ATTRIBUTION = (
 	"Warning icons by NRK/yr.no, CC BY 4.0, "
@@ -18,7 +60,17 @@ DOMAIN = "met_alerts"
 DEFAULT_NAME = "Met Alerts"
 DEFAULT_LANG = "no"
 CONF_LANG = "lang"
-PLATFORMS = ["sensor"]
+CONF_BILINGUAL = "bilingual"
+PLATFORMS = ["sensor", "binary_sensor", "image", "calendar"]
+
+# Dispatcher signal sent when an entry is unloaded, formatted with the entry id
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded_{{}}"
+
+# Seconds a payload fetched by the config flow stays usable for the first refresh
+VALIDATION_HANDOFF_TTL = 60
+
+# Locations validated at the same time by the bulk import service
+BULK_IMPORT_WORKERS = 5
 
 # 48x48 icons with 8px padding
 ICON_DATA_URLS = {
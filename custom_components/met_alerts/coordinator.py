@@ -0,0 +1,410 @@
+"""Data update coordinator for Met Alerts."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from datetime import timedelta
+import time
+
+import aiohttp
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import Event, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DEFAULT_REFRESH_MIN_INTERVAL, DEFAULT_TRACKER_PRECISION
+from .core import MetAlertsError, alert_id, async_fetch_alerts, merge_languages, point_in_geometry
+from .county_feed import COUNTY_FEEDS_KEY, CountyFeeds
+from .fixtures import FixtureReplayer, load_recording, load_testville
+from .geocell import CellCache, geohash, geohash_center
+from .handoff import pop_validated_payload
+from .interval_index import AlertIntervalIndex
+from .map_cache import async_get_map_cache
+from .providers import AlertPipeline, MetAlertsProvider, ProviderStats, VarsomProvider
+from .registry import ALERT_REGISTRY_KEY, AlertRegistry
+from .thresholds import evaluate_thresholds
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(minutes=30)
+# Minimum time between refreshes caused by the tracker entering new cells
+TRACKER_REFRESH_COOLDOWN = timedelta(minutes=5)
+
+
+class MetAlertsCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Met Alerts data."""
+
+    def __init__(
+        self,
+        hass,
+        *,
+        latitude,
+        longitude,
+        lang,
+        test_mode=False,
+        fixture_path=None,
+        fixture_speed=1.0,
+        varsom=False,
+        county=None,
+        local_maps=False,
+        severity_thresholds=(),
+        event_thresholds=(),
+        tracker=None,
+        tracker_precision=DEFAULT_TRACKER_PRECISION,
+        county_mode=False,
+        point_filter=False,
+        bilingual=False,
+        refresh_min_interval=DEFAULT_REFRESH_MIN_INTERVAL,
+    ):
+        """Initialize coordinator."""
+        if fixture_path:
+            # Poll a replayed recording as often as the accelerated clock requires
+            update_interval = SCAN_INTERVAL / fixture_speed
+        elif county_mode and county and not tracker:
+            # The shared county feed triggers every refresh
+            update_interval = None
+        else:
+            update_interval = SCAN_INTERVAL
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+        self.latitude = latitude
+        self.longitude = longitude
+        self.lang = lang
+        # Languages to fetch; with bilingual on, the other language is merged into the primary one
+        self.languages = (lang, "en" if lang == "no" else "no") if bilingual else (lang,)
+        self.test_mode = test_mode
+        self.fixture_path = fixture_path
+        self.fixture_speed = fixture_speed
+        self.local_maps = local_maps
+        self._replayer: FixtureReplayer | None = None
+        self._test_features: list[dict] | None = None
+        # Last MetAlerts payload before test alerts were added
+        self._raw_payload: dict | None = None
+        # Entry data and options this coordinator was set up with
+        self.entry_config: tuple[dict, dict] = ({}, {})
+        # Normalized alerts from all providers keyed by alert id, rebuilt once per refresh
+        self.alerts: dict[str, dict] = {}
+        self.provider_stats: dict[str, ProviderStats] = {}
+        # Validity windows of self.alerts, for calendar range queries
+        self.interval_index = AlertIntervalIndex(dt_util.DEFAULT_TIME_ZONE)
+        self.severity_thresholds = tuple(severity_thresholds)
+        self.event_thresholds = tuple(event_thresholds)
+        # Threshold binary sensor states keyed by threshold key, recomputed once per refresh
+        self.thresholds: dict[str, bool] = {}
+
+        # On-demand refreshes: minimum seconds between them, the one in flight,
+        # and the cache age it accepts while running
+        self.refresh_min_interval = refresh_min_interval
+        # Start of the last refresh, successful or not
+        self._last_attempt: float | None = None
+        self._on_demand: asyncio.Task | None = None
+        self._max_age: float | None = None
+        # Person or device tracker to follow, and the geohash cell it is in
+        self.tracker = tracker
+        self.tracker_precision = tracker_precision
+        self.cell: str | None = None
+        # Expire just before the next scheduled refresh so that it fetches again
+        self._cell_cache = CellCache(
+            ttl=(SCAN_INTERVAL - timedelta(minutes=1)).total_seconds(),
+            on_evict=lambda cell: self.registry.release((self, cell)),
+        )
+        self._cell_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TRACKER_REFRESH_COOLDOWN.total_seconds(),
+            immediate=True,
+            function=self.async_refresh,
+        )
+
+        # Query the whole county through a feed shared with the other entries in it
+        self.county = county
+        self.county_mode = county_mode and bool(county)
+        self.point_filter = point_filter
+        county_feeds: CountyFeeds = hass.data.setdefault(DOMAIN, {}).setdefault(
+            COUNTY_FEEDS_KEY, CountyFeeds(hass, SCAN_INTERVAL)
+        )
+        self._county_feeds = [county_feeds.get(county, lang) for lang in self.languages] if self.county_mode else []
+        self._county_fetching = False
+        # Alerts shared with the other entries; this coordinator references those in its last payload
+        self.registry: AlertRegistry = hass.data.setdefault(DOMAIN, {}).setdefault(
+            ALERT_REGISTRY_KEY, AlertRegistry()
+        )
+
+        self._met = MetAlertsProvider(self._async_fetch_met_payload, self.registry.record)
+        providers = [self._met]
+        self._varsom = None
+        if varsom:
+            self._varsom = VarsomProvider(latitude, longitude, lang, county)
+            providers.append(self._varsom)
+        self.pipeline = AlertPipeline(providers)
+
+    def async_start_tracking(self) -> Callable[[], None]:
+        """Follow the tracker's position and return a callback that stops it.
+
+        Positions are snapped to geohash cells. Entering another cell
+        refreshes at most once per TRACKER_REFRESH_COOLDOWN, and cells seen
+        within the cache TTL are served without a request.
+        """
+        if (cell := self._tracker_cell(self.hass.states.get(self.tracker))) is not None:
+            self._move_to_cell(cell)
+        unsubscribe = async_track_state_change_event(self.hass, [self.tracker], self._handle_tracker_change)
+
+        def stop() -> None:
+            unsubscribe()
+            self._cell_debouncer.async_cancel()
+
+        return stop
+
+    def async_start_county_feeds(self) -> Callable[[], None]:
+        """Refresh whenever the shared county feeds fetch, and return a callback that stops it.
+
+        The feeds poll on their own schedule and this coordinator has no
+        schedule of its own, so each feed fetch refreshes it exactly once.
+        """
+        removers = [feed.async_add_listener(self._handle_county_update) for feed in self._county_feeds]
+
+        def stop() -> None:
+            for remove in removers:
+                remove()
+
+        return stop
+
+    @callback
+    def _handle_county_update(self) -> None:
+        # A fetch this coordinator is waiting for is used by its running refresh
+        if not self._county_fetching:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _tracker_cell(self, state: State | None) -> str | None:
+        """Return the geohash cell of a tracker state, if it has a position."""
+        if state is None:
+            return None
+        latitude = state.attributes.get(ATTR_LATITUDE)
+        longitude = state.attributes.get(ATTR_LONGITUDE)
+        if latitude is None or longitude is None:
+            return None
+        return geohash(latitude, longitude, self.tracker_precision)
+
+    def _move_to_cell(self, cell: str) -> None:
+        """Query alerts for the center of a cell from now on."""
+        self.cell = cell
+        self.latitude, self.longitude = geohash_center(cell)
+        if self._varsom is not None:
+            self._varsom.latitude, self._varsom.longitude = self.latitude, self.longitude
+        _LOGGER.debug("%s moved to cell %s", self.tracker, cell)
+
+    @callback
+    def _handle_tracker_change(self, event: Event) -> None:
+        cell = self._tracker_cell(event.data.get("new_state"))
+        if cell is None or cell == self.cell:
+            return
+        self._move_to_cell(cell)
+        self._cell_debouncer.async_schedule_call()
+
+    async def _async_update_data(self):
+        """Fetch all alert providers concurrently and merge their alerts.
+
+        MetAlerts is required; other providers fall back to their last
+        alerts when they fail or time out.
+        """
+        self._last_attempt = time.monotonic()
+        result = await self.pipeline.async_run()
+        if (err := result.errors.get(MetAlertsProvider.name)) is not None:
+            if isinstance(err, UpdateFailed):
+                raise err
+            raise UpdateFailed(f"Error fetching data: {err}") from err
+
+        self.alerts = await self._async_localize_maps(result.alerts) if self.local_maps else result.alerts
+        self.provider_stats = result.stats
+        self._update_interval_index()
+        self._update_thresholds()
+        return self._met.payload
+
+    async def async_refresh_on_demand(self) -> bool:
+        """Refresh now unless the last refresh started within the minimum interval.
+
+        Failed refreshes count too, so an outage does not send every call to
+        the API. Concurrent calls share one refresh. Cached cell and county payloads
+        older than the minimum interval are fetched again. Returns whether a
+        refresh ran.
+        """
+        if self._on_demand is None:
+            if self._last_attempt is not None and time.monotonic() - self._last_attempt < self.refresh_min_interval:
+                return False
+            self._on_demand = self.hass.async_create_task(self._async_refresh_on_demand())
+        await asyncio.shield(self._on_demand)
+        return True
+
+    async def _async_refresh_on_demand(self) -> None:
+        self._max_age = self.refresh_min_interval
+        try:
+            await self.async_refresh()
+        finally:
+            self._max_age = None
+            self._on_demand = None
+
+    async def async_set_test_mode(self, test_mode: bool) -> None:
+        """Switch test mode using the last payload instead of fetching again."""
+        self.test_mode = test_mode
+        if self._raw_payload is None:
+            await self.async_request_refresh()
+            return
+        payload = await self._async_add_test_alerts(self._raw_payload)
+        self._met.payload = payload
+        alerts = self.pipeline.replace_alerts(
+            MetAlertsProvider.name, [self.registry.record(feature) for feature in payload.get("features", [])]
+        )
+        self.alerts = await self._async_localize_maps(alerts) if self.local_maps else alerts
+        self._update_interval_index()
+        self._update_thresholds()
+        self.async_set_updated_data(payload)
+
+    def _update_thresholds(self) -> None:
+        """Evaluate the configured severity and event thresholds against the current alerts."""
+        self.thresholds = evaluate_thresholds(self.alerts.values(), self.severity_thresholds, self.event_thresholds)
+
+    def _update_interval_index(self) -> None:
+        """Sync the interval index with the current alerts.
+
+        MetAlerts windows come from the feature's ``when.interval``, other
+        providers' from valid_from/valid_to. Only new or changed windows are
+        parsed.
+        """
+        windows = {
+            key: (alert["valid_from"], alert["valid_to"])
+            for key, alert in self.alerts.items()
+        }
+        for feature in (self._met.payload or {}).get("features", []):
+            interval = feature.get("when", {}).get("interval") or []
+            key = alert_id(feature)
+            if len(interval) == 2 and key in windows:
+                windows[key] = tuple(interval)
+        self.interval_index.update(windows)
+
+    async def _async_localize_maps(self, alerts: dict[str, dict]) -> dict[str, dict]:
+        """Point map_url at the local map cache, keeping the original as remote_map_url."""
+        try:
+            cache = await async_get_map_cache(self.hass)
+        except OSError as err:
+            _LOGGER.warning("Cannot set up the local map cache, using remote map URLs: %s", err)
+            return alerts
+        localized = {}
+        for key, alert in alerts.items():
+            if alert["map_url"]:
+                alert = {
+                    **alert,
+                    "map_url": cache.register(key, alert["map_url"], alert["valid_to"]),
+                    "remote_map_url": alert["map_url"],
+                }
+            localized[key] = alert
+        return localized
+
+    async def _async_fetch_met_payload(self):
+        """Return the MetAlerts GeoJSON, from a recording, the config flow or the API."""
+        if self.fixture_path:
+            json_data = await self._async_replay()
+        elif self.cell is not None:
+            json_data = await self._async_fetch_cell()
+        elif self.county_mode:
+            json_data = await self._async_fetch_county()
+        elif len(self.languages) == 1 and (json_data := pop_validated_payload(self.hass, self.latitude, self.longitude, self.lang)) is not None:
+            _LOGGER.debug("Reusing Met alerts payload fetched during config validation")
+        else:
+            json_data = await self._async_fetch()
+        # Keep the instances shared with other entries rather than this response's copies
+        json_data = {**json_data, "features": self.registry.intern(self, json_data.get("features", []))}
+        self._raw_payload = json_data
+        return await self._async_add_test_alerts(json_data)
+
+    def async_release(self) -> None:
+        """Drop this coordinator's references to shared alerts."""
+        self._cell_cache.clear()
+        self.registry.release(self)
+
+    async def _async_fetch_cell(self):
+        """Return the alerts for the tracker's cell, fetching only if they are not cached or stale."""
+        cell = self.cell
+        if (json_data := self._cell_cache.get(cell, self._max_age)) is not None:
+            _LOGGER.debug("Reusing cached Met alerts payload for cell %s", cell)
+            return json_data
+        json_data = await self._async_fetch()
+        # Cached cells reference the shared instances rather than keeping copies of their own
+        json_data = {**json_data, "features": self.registry.intern((self, cell), json_data.get("features", []))}
+        self._cell_cache.put(cell, json_data)
+        return json_data
+
+    async def _async_fetch_county(self):
+        """Return the county's alerts, optionally only those covering this location."""
+        self._county_fetching = True
+        try:
+            payloads = await asyncio.gather(*(feed.async_get(self._max_age) for feed in self._county_feeds))
+        except MetAlertsError as err:
+            raise UpdateFailed(str(err)) from err
+        finally:
+            self._county_fetching = False
+        json_data = payloads[0] if len(payloads) == 1 else merge_languages(dict(zip(self.languages, payloads)), self.lang)
+        if self.point_filter:
+            features = [
+                feature
+                for feature in json_data.get("features", [])
+                if point_in_geometry(feature.get("geometry"), self.latitude, self.longitude)
+            ]
+            json_data = {**json_data, "features": features}
+        return json_data
+
+    async def _async_add_test_alerts(self, json_data):
+        """Return the payload with test alerts added when test mode is on."""
+        # Inject test alerts if test mode is enabled. The fixture is read from
+        # disk once and shared, so build a new list rather than extending it.
+        if self.test_mode:
+            if self._test_features is None:
+                test_payload = await self.hass.async_add_executor_job(load_testville)
+                self._test_features = test_payload["features"]
+            test_features = self._test_features
+            json_data = {**json_data, "features": [*json_data.get("features", []), *test_features]}
+            _LOGGER.info("Test mode: Injected %d fake alerts for Testville", len(test_features))
+
+        # Log the number of features found
+        features = json_data.get("features", [])
+        _LOGGER.info("Found %d alert(s) in response", len(features))
+
+        # Log details of each alert
+        for idx, feature in enumerate(features):
+            props = feature.get("properties", {})
+            _LOGGER.info(
+                "Alert %d: event='%s', awareness_level='%s', title='%s'",
+                idx + 1,
+                props.get("event"),
+                props.get("awareness_level"),
+                props.get("title"),
+            )
+
+        return json_data
+
+    async def _async_replay(self):
+        """Return the current frame of the configured recording instead of calling the API."""
+        if self._replayer is None:
+            path = self.hass.config.path(self.fixture_path)
+            try:
+                frames = await self.hass.async_add_executor_job(load_recording, path)
+                self._replayer = FixtureReplayer(frames, self.fixture_speed)
+            except (OSError, ValueError, KeyError) as err:
+                raise UpdateFailed(f"Cannot load fixture {path}: {err}")
+            _LOGGER.info("Replaying %d recorded frame(s) from %s at %sx speed", len(frames), path, self.fixture_speed)
+        return self._replayer.payload()
+
+    async def _async_fetch(self):
+        """Download and parse the current alerts for this location, in every language concurrently."""
+        try:
+            async with aiohttp.ClientSession() as session:
+                payloads = await asyncio.gather(
+                    *(async_fetch_alerts(session, self.latitude, self.longitude, lang) for lang in self.languages)
+                )
+        except MetAlertsError as err:
+            raise UpdateFailed(str(err)) from err
+        if len(payloads) == 1:
+            return payloads[0]
+        return merge_languages(dict(zip(self.languages, payloads)), self.lang)
@@ -0,0 +1,250 @@
+"""Fetch, normalize and sort MetAlerts without Home Assistant.
+
+The Home Assistant platforms are thin adapters around these functions, and
+``utils/query_alerts.py`` uses them directly to run and time queries.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+
+import aiohttp
+
+from .const import ICON_DATA_URLS
+
+_LOGGER = logging.getLogger(__name__)
+
+API_URL = "https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0/current.json"
+
+# Attributes of a legacy mode sensor, in order; a prefix of the normalized record
+LEGACY_FIELDS = (
+    "title",
+    "starttime",
+    "endtime",
+    "description",
+    "awareness_level",
+    "awareness_level_numeric",
+    "awareness_level_color",
+    "certainty",
+    "severity",
+    "instruction",
+    "contact",
+    "resources",
+    "area",
+    "event_awareness_name",
+    "consequences",
+    "map_url",
+)
+
+# Language dependent record fields and the feature properties they come from
+TEXT_FIELDS = {
+    "title": "title",
+    "description": "description",
+    "instruction": "instruction",
+    "consequences": "consequences",
+    "area": "area",
+    "event_awareness_name": "eventAwarenessName",
+}
+
+
+class MetAlertsError(Exception):
+    """The MetAlerts API could not be queried."""
+
+
+async def async_fetch_alerts(
+    session: aiohttp.ClientSession, latitude: float, longitude: float, lang: str, timeout: float = 10
+) -> dict:
+    """Download the current alerts GeoJSON for a location.
+
+    Raises MetAlertsError for HTTP, content and decoding errors. Timeouts
+    propagate as TimeoutError.
+    """
+    return await _async_get_geojson(session, {"lat": latitude, "lon": longitude, "lang": lang}, timeout)
+
+
+async def async_fetch_county_alerts(
+    session: aiohttp.ClientSession, county: str, lang: str, timeout: float = 10
+) -> dict:
+    """Download the current alerts GeoJSON for a county, e.g. "46" for Vestland."""
+    return await _async_get_geojson(session, {"county": county, "lang": lang}, timeout)
+
+
+async def _async_get_geojson(session: aiohttp.ClientSession, params: dict, timeout: float) -> dict:
+    try:
+        async with asyncio.timeout(timeout):
+            async with session.get(API_URL, params=params) as response:
+                if response.status != 200:
+                    _LOGGER.error("Error fetching data: %s", response.status)
+                    raise MetAlertsError(f"Error fetching data: {response.status}")
+
+                content_type = response.headers.get("Content-Type", "")
+                if "application/json" not in content_type:
+                    _LOGGER.error("Unexpected Content-Type: %s", content_type)
+                    raise MetAlertsError(f"Unexpected Content-Type: {content_type}")
+
+                response_text = await response.text()
+                if not response_text:
+                    _LOGGER.error("Received empty response")
+                    raise MetAlertsError("Received empty response")
+
+                try:
+                    json_data = await response.json()
+                except aiohttp.ClientResponseError as err:
+                    _LOGGER.error("JSON decode error: Response content was empty or invalid")
+                    _LOGGER.debug("Response content: %s", response_text)
+                    raise MetAlertsError(f"JSON decode error: {err}") from err
+                _LOGGER.info("Successfully fetched Met alerts data")
+                _LOGGER.debug("Full API response: %s", json_data)
+                return json_data
+    except aiohttp.ClientError as err:
+        raise MetAlertsError(f"Error fetching data: {err}") from err
+
+
+def point_in_geometry(geometry: dict | None, latitude: float, longitude: float) -> bool:
+    """Return whether a point lies inside a Polygon or MultiPolygon geometry.
+
+    Uses the even-odd rule over all rings, so holes are excluded.
+    """
+    if not geometry:
+        return False
+    if geometry.get("type") == "Polygon":
+        rings = geometry.get("coordinates", [])
+    elif geometry.get("type") == "MultiPolygon":
+        rings = [ring for polygon in geometry.get("coordinates", []) for ring in polygon]
+    else:
+        return False
+    inside = False
+    for ring in rings:
+        for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:] + ring[:1]):
+            if (y1 > latitude) != (y2 > latitude) and longitude < x1 + (latitude - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
+
+
+def merge_languages(payloads: dict[str, dict], primary: str) -> dict:
+    """Merge responses in several languages into the primary one by alert id.
+
+    Geometry and language independent properties are kept once, from the
+    primary response. Each feature gains a ``translations`` property with the
+    text properties per language.
+    """
+    texts: dict[str, dict[str, dict]] = {}
+    for lang, payload in payloads.items():
+        for feature in payload.get("features", []):
+            props = feature.get("properties", {})
+            texts.setdefault(alert_id(feature), {})[lang] = {
+                name: props.get(name, "") for name in TEXT_FIELDS.values()
+            }
+    features = [
+        {
+            **feature,
+            "properties": {**feature.get("properties", {}), "translations": texts[alert_id(feature)]},
+        }
+        for feature in payloads[primary].get("features", [])
+    ]
+    return {**payloads[primary], "features": features}
+
+
+def sort_features(features: list[dict]) -> list[dict]:
+    """Return alert features with the highest awareness level first."""
+    return sorted(features, key=lambda feature: feature["properties"]["awareness_level"], reverse=True)
+
+
+def icon_url(event: str, color: str) -> str | None:
+    """Return the warning icon data URL for an event type and awareness color."""
+    event = event.lower().replace(" ", "-")
+    key = f"{event}-{color.lower()}" if color else event
+    return ICON_DATA_URLS.get(key)
+
+
+def alert_id(feature: dict) -> str:
+    """Return a stable identifier for an alert feature."""
+    props = feature.get("properties", {})
+    return props.get("id") or f"{props.get('event', '')}_{props.get('title', '')}"
+
+
+def normalize_alert(feature: dict) -> dict:
+    """Convert a GeoJSON alert feature to the flat alert record used by the array sensor."""
+    props = feature.get("properties", {})
+    title, starttime, endtime = extract_times_from_title(props.get("title", ""))
+    awareness_level = props.get("awareness_level", "")
+    try:
+        awareness_level_numeric, awareness_level_color, _ = awareness_level.split("; ")
+    except ValueError:
+        awareness_level_numeric = ""
+        awareness_level_color = ""
+
+    # Get resource URL for unified schema
+    resource_url = ""
+    resources = props.get("resources", [])
+    if resources and len(resources) > 0:
+        resource_url = resources[0].get("uri", "")
+
+    # Extract PNG map URL (for inline image display)
+    map_url = None
+    for resource in resources:
+        if resource.get("mimeType") == "image/png":
+            map_url = resource.get("uri")
+            break
+
+    # Parse numeric severity level
+    severity_level = int(awareness_level_numeric) if awareness_level_numeric else 1
+
+    record = {
+        # ===== EXISTING FIELDS (backward compatibility) =====
+        "title": title,
+        "starttime": starttime,
+        "endtime": endtime,
+        "description": props.get("description", ""),
+        "awareness_level": awareness_level,
+        "awareness_level_numeric": awareness_level_numeric,
+        "awareness_level_color": awareness_level_color,
+        "certainty": props.get("certainty", ""),
+        "severity": props.get("severity", ""),
+        "instruction": props.get("instruction", ""),
+        "contact": props.get("contact", ""),
+        "resources": resources,
+        "area": props.get("area", ""),
+        "event_awareness_name": props.get("eventAwarenessName", ""),
+        "consequences": props.get("consequences", ""),
+        "map_url": map_url,
+
+        # ===== UNIFIED SCHEMA FIELDS (for cross-integration compatibility) =====
+        "id": alert_id(feature),                          # Stable alert identifier
+        "source": "met_alerts",                           # Integration identifier
+        "alert_category": "weather",                      # Category: weather/geohazard
+        "alert_type": props.get("event", ""),            # Alert type: gale, rain, snow, etc.
+        "severity_level": severity_level,                 # Numeric level 1-3 (Yellow=1, Orange=2, Red=3)
+        "severity_color": awareness_level_color,          # Color: yellow, orange, red
+        "severity_name": props.get("severity", ""),      # Name: Moderate, Severe, Extreme
+        "valid_from": starttime,                          # ISO8601 start time (alias for starttime)
+        "valid_to": endtime,                              # ISO8601 end time (alias for endtime)
+        "areas": [props.get("area", "")] if props.get("area") else [],  # Array of affected areas
+        "url": resource_url,                              # Link to detailed information
+    }
+
+    # Text fields per language, when fetched in several languages
+    if "translations" in props:
+        record["translations"] = {
+            lang: {
+                field: extract_times_from_title(texts.get(prop, ""))[0] if field == "title" else texts.get(prop, "")
+                for field, prop in TEXT_FIELDS.items()
+            }
+            for lang, texts in props["translations"].items()
+        }
+    return record
+
+
+def extract_times_from_title(title: str) -> tuple[str, str | None, str | None]:
+    """Extract timestamps from alert title."""
+    timestamps = re.findall(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\+\d{2}:\d{2}", title)
+
+    if len(timestamps) >= 2:
+        starttime = timestamps[0]
+        endtime = timestamps[1]
+        # Remove the timestamps from the title
+        title = title.replace(starttime, "").replace(endtime, "").strip(", ").strip()
+        return title, starttime, endtime
+    else:
+        return title, None, None
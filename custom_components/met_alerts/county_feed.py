@@ -0,0 +1,123 @@
+"""County queries shared by every entry in the same county."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+import time
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .core import async_fetch_county_alerts
+
+_LOGGER = logging.getLogger(__name__)
+
+COUNTY_FEEDS_KEY = "county_feeds"
+# Seconds before entries retry a failed county fetch themselves, between scheduled fetches
+COUNTY_RETRY_DELAY = 60
+
+
+class CountyFeed:
+    """One county's alerts in one language, fetched once per interval for all entries.
+
+    The feed only polls while entries listen to it, and tells them after
+    every fetch, so their alerts are never older than one interval and a
+    failed fetch is reported to all of them. Concurrent fetches share one
+    download.
+    """
+
+    def __init__(self, hass: HomeAssistant, county: str, lang: str, interval: timedelta):
+        self.hass = hass
+        self.county = county
+        self.lang = lang
+        self.interval = interval
+        self.payload: dict | None = None
+        self.error: Exception | None = None
+        self._attempted_at: float | None = None
+        self._pending: asyncio.Task | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback after every fetch and return a callback that stops it."""
+        self._listeners.append(update_callback)
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(self.hass, self._async_scheduled_fetch, self.interval)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+            if not self._listeners and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return remove_listener
+
+    async def _async_scheduled_fetch(self, _now: datetime) -> None:
+        try:
+            await self.async_fetch()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Error fetching alerts for county %s: %s", self.county, err)
+
+    async def async_fetch(self) -> dict:
+        """Fetch the county's alerts now, or join a fetch that is already running."""
+        if self._pending is None:
+            self._pending = self.hass.async_create_task(self._async_fetch())
+        return await asyncio.shield(self._pending)
+
+    async def _async_fetch(self) -> dict:
+        self._attempted_at = time.monotonic()
+        try:
+            async with aiohttp.ClientSession() as session:
+                self.payload = await async_fetch_county_alerts(session, self.county, self.lang)
+            self.error = None
+        except Exception as err:
+            self.error = err
+            raise
+        finally:
+            self._pending = None
+            for update_callback in list(self._listeners):
+                update_callback()
+        _LOGGER.debug("Fetched %d alert(s) for county %s", len(self.payload.get("features", [])), self.county)
+        return self.payload
+
+    async def async_get(self, max_age: float | None = None) -> dict:
+        """Return the latest alerts, fetching them first if they were never fetched.
+
+        They are also fetched when the last attempt is older than ``max_age``
+        seconds, or failed more than COUNTY_RETRY_DELAY seconds ago; a more
+        recent failure is raised again.
+        """
+        if self._pending is not None:
+            return await asyncio.shield(self._pending)
+        age = None if self._attempted_at is None else time.monotonic() - self._attempted_at
+        if (
+            age is None
+            or (max_age is not None and age >= max_age)
+            or (self.error is not None and age >= COUNTY_RETRY_DELAY)
+        ):
+            return await self.async_fetch()
+        if self.error is not None:
+            raise self.error
+        return self.payload
+
+
+class CountyFeeds:
+    """The county feeds of all entries, one per county and language."""
+
+    def __init__(self, hass: HomeAssistant, interval: timedelta):
+        self.hass = hass
+        self.interval = interval
+        self._feeds: dict[tuple[str, str], CountyFeed] = {}
+
+    def get(self, county: str, lang: str) -> CountyFeed:
+        """Return the feed of a county and language."""
+        key = (county, lang)
+        if (feed := self._feeds.get(key)) is None:
+            feed = self._feeds[key] = CountyFeed(self.hass, county, lang, self.interval)
+        return feed
@@ -0,0 +1,25 @@
+"""Diagnostics support for Met Alerts."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import MetAlertsCoordinator
+
+TO_REDACT = {CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry's configuration and the outcome of each alert source's last fetch."""
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "data": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "alerts": len(coordinator.alerts),
+        "sources": {name: stats.as_dict() for name, stats in coordinator.provider_stats.items()},
+    }
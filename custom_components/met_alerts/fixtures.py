@@ -0,0 +1,194 @@
+"""Recorded, replayed and synthetic alert payloads for testing.
+
+This module must not depend on Home Assistant so that the helper scripts in
+``utils/`` can import it directly.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import json
+import math
+from pathlib import Path
+import random
+import time
+
+FIXTURE_DIR = Path(__file__).parent / "fixture_data"
+TESTVILLE_FIXTURE = FIXTURE_DIR / "testville.json"
+
+DEFAULT_EVENTS = ("gale", "rain", "snow", "icing", "forestFire", "lightning", "stormSurge")
+
+# (awareness_level, severity, riskMatrixColor) as returned by the MetAlerts API
+DEFAULT_LEVELS = (
+    ("2; yellow; Moderate", "Moderate", "Yellow"),
+    ("3; orange; Severe", "Severe", "Orange"),
+    ("4; red; Extreme", "Extreme", "Red"),
+)
+
+
+def load_payload(path: str | Path) -> dict:
+    """Load a GeoJSON payload from disk.
+
+    This does blocking I/O; call it from an executor inside Home Assistant.
+    """
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=1)
+def load_testville() -> dict:
+    """Load the bundled Testville payload once and cache it.
+
+    This does blocking I/O the first time; call it from an executor inside
+    Home Assistant. Callers must treat the returned payload as read-only.
+    """
+    return load_payload(TESTVILLE_FIXTURE)
+
+
+def load_recording(path: str | Path) -> list[dict]:
+    """Load the frames of a recording, reading the file again on every call.
+
+    A plain FeatureCollection (e.g. a saved API response) is treated as a
+    recording with a single frame.
+    """
+    data = load_payload(path)
+    if "frames" not in data:
+        return [{"offset": 0.0, "payload": data}]
+    return sorted(data["frames"], key=lambda frame: frame["offset"])
+
+
+class FixtureRecorder:
+    """Collect real API responses into a recording file."""
+
+    def __init__(self, path: str | Path, query: dict | None = None, clock: Callable[[], float] = time.monotonic):
+        self.path = Path(path)
+        self.query = query or {}
+        self._clock = clock
+        self._started: float | None = None
+        self.frames: list[dict] = []
+
+    def record(self, payload: dict) -> None:
+        """Add a response, timestamped relative to the first one."""
+        now = self._clock()
+        if self._started is None:
+            self._started = now
+        self.frames.append({"offset": round(now - self._started, 3), "payload": payload})
+
+    def save(self) -> None:
+        """Write the recording to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"query": self.query, "frames": self.frames}, file, ensure_ascii=False)
+
+
+class FixtureReplayer:
+    """Replay recorded frames deterministically, optionally on an accelerated clock.
+
+    With ``speed=60`` an hour of recording plays back in a minute. After the
+    last frame the replayer keeps returning it.
+    """
+
+    def __init__(self, frames: Sequence[dict], speed: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        if not frames:
+            raise ValueError("Recording has no frames")
+        if speed <= 0:
+            raise ValueError("Replay speed must be positive")
+        self._frames = list(frames)
+        self._offsets = [frame["offset"] for frame in self._frames]
+        self.speed = speed
+        self._clock = clock
+        self._started = clock()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds of recording time that have played so far."""
+        return (self._clock() - self._started) * self.speed
+
+    def payload(self) -> dict:
+        """Return the frame that is current on the replay clock."""
+        index = max(bisect_right(self._offsets, self.elapsed) - 1, 0)
+        return self._frames[index]["payload"]
+
+
+def _polygon(rng: random.Random, center: tuple[float, float], radius: float, vertices: int) -> list[list[float]]:
+    """Return a closed, slightly irregular ring of lon/lat pairs around center."""
+    lat, lon = center
+    ring = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        r = radius * rng.uniform(0.7, 1.0)
+        # Stretch longitude so polygons look round at Norwegian latitudes
+        ring.append([
+            round(lon + r * math.cos(angle) / max(math.cos(math.radians(lat)), 0.1), 5),
+            round(lat + r * math.sin(angle), 5),
+        ])
+    ring.append(ring[0])
+    return ring
+
+
+def generate_alerts(
+    count: int,
+    *,
+    events: Sequence[str] = DEFAULT_EVENTS,
+    levels: Sequence[tuple[str, str, str]] = DEFAULT_LEVELS,
+    center: tuple[float, float] = (60.39, 5.32),
+    spread: float = 2.0,
+    radius: float = 0.5,
+    vertices: int = 16,
+    start: datetime | None = None,
+    window_hours: float = 48,
+    min_duration_hours: float = 3,
+    max_duration_hours: float = 36,
+    seed: int = 0,
+) -> dict:
+    """Generate a FeatureCollection with ``count`` synthetic alerts.
+
+    The output is deterministic for a given seed and start time, and uses the
+    same shape as the MetAlerts ``current.json`` response.
+    """
+    rng = random.Random(seed)
+    if start is None:
+        start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    features = []
+    for i in range(count):
+        event = rng.choice(list(events))
+        awareness_level, severity, color = rng.choice(list(levels))
+        area = f"Synthetic area {i + 1}"
+        onset = start + timedelta(hours=round(rng.uniform(0, window_hours)))
+        ending = onset + timedelta(hours=round(rng.uniform(min_duration_hours, max_duration_hours)))
+        alert_center = (
+            center[0] + rng.uniform(-spread, spread),
+            center[1] + rng.uniform(-spread, spread),
+        )
+        features.append({
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [_polygon(rng, alert_center, radius, vertices)],
+            },
+            "when": {"interval": [onset.isoformat(), ending.isoformat()]},
+            "properties": {
+                "area": area,
+                "awareness_level": awareness_level,
+                "certainty": "Likely",
+                "consequences": f"Synthetic consequences for {event} in {area}.",
+                "contact": "https://www.met.no/",
+                "county": [],
+                "description": f"Synthetic {event} alert number {i + 1}.",
+                "event": event,
+                "eventAwarenessName": f"{color} {event}",
+                "eventEndingTime": ending.isoformat(),
+                "geographicDomain": "land",
+                "id": f"synthetic.{seed}.{i + 1}",
+                "instruction": "This alert was generated for testing.",
+                "resources": [],
+                "riskMatrixColor": color,
+                "severity": severity,
+                "title": f"{event.capitalize()}, {color.lower()} level, {area}, {onset.isoformat()}, {ending.isoformat()}",
+                "type": "Alert",
+                "web": "https://www.met.no/",
+            },
+        })
+    return {"type": "FeatureCollection", "features": features}
@@ -0,0 +1,106 @@
+"""Geohash cells and a per-cell payload cache for following a moving location."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import time
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(latitude: float, longitude: float, precision: int = 5) -> str:
+    """Return the geohash cell of a position.
+
+    Cells are roughly 39x20 km at precision 4, 5x5 km at 5 and 1.2x0.6 km at 6.
+    """
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    value = bits = 0
+    even = True
+    while len(chars) < precision:
+        bounds, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (bounds[0] + bounds[1]) / 2
+        if coordinate >= mid:
+            value = value * 2 + 1
+            bounds[0] = mid
+        else:
+            value *= 2
+            bounds[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            value = bits = 0
+    return "".join(chars)
+
+
+def geohash_center(cell: str) -> tuple[float, float]:
+    """Return the (latitude, longitude) center of a geohash cell, rounded to 4 decimals."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in cell:
+        value = _BASE32.index(char)
+        for shift in range(4, -1, -1):
+            bounds = lon_range if even else lat_range
+            mid = (bounds[0] + bounds[1]) / 2
+            if value >> shift & 1:
+                bounds[0] = mid
+            else:
+                bounds[1] = mid
+            even = not even
+    return round(sum(lat_range) / 2, 4), round(sum(lon_range) / 2, 4)
+
+
+class CellCache:
+    """LRU cache of payloads per cell that expire after ``ttl`` seconds.
+
+    ``on_evict`` is called with the cell of every payload that is dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 16,
+        ttl: float = 1800,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Callable[[str], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._on_evict = on_evict
+        # cell -> (fetched at, payload), least recently used first
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def get(self, cell: str, max_age: float | None = None) -> dict | None:
+        """Return the payload for a cell if it is still fresh.
+
+        ``max_age`` makes the check stricter than the TTL for this lookup.
+        """
+        cached = self._entries.get(cell)
+        if cached is None:
+            return None
+        age = self._clock() - cached[0]
+        if age >= self.ttl:
+            self._evict(cell)
+            return None
+        if max_age is not None and age >= max_age:
+            return None
+        self._entries.move_to_end(cell)
+        return cached[1]
+
+    def put(self, cell: str, payload: dict) -> None:
+        """Store a freshly fetched payload for a cell."""
+        self._entries[cell] = (self._clock(), payload)
+        self._entries.move_to_end(cell)
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop all payloads."""
+        for cell in list(self._entries):
+            self._evict(cell)
+
+    def _evict(self, cell: str) -> None:
+        del self._entries[cell]
+        if self._on_evict is not None:
+            self._on_evict(cell)
@@ -0,0 +1,37 @@
+"""Short-lived handoff of validated API payloads from the config flow to setup."""
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, VALIDATION_HANDOFF_TTL
+
+HANDOFF_KEY = "validated_payloads"
+
+
+def _key(latitude: float, longitude: float, lang: str) -> tuple[float, float, str]:
+    return (float(latitude), float(longitude), lang)
+
+
+def store_validated_payload(
+    hass: HomeAssistant, latitude: float, longitude: float, lang: str, payload: dict
+) -> None:
+    """Keep a payload fetched during validation for the first coordinator refresh."""
+    payloads = hass.data.setdefault(DOMAIN, {}).setdefault(HANDOFF_KEY, {})
+    payloads[_key(latitude, longitude, lang)] = (time.monotonic(), payload)
+
+
+def pop_validated_payload(
+    hass: HomeAssistant, latitude: float, longitude: float, lang: str
+) -> dict | None:
+    """Return and forget a validated payload if it is still fresh."""
+    payloads = hass.data.get(DOMAIN, {}).get(HANDOFF_KEY)
+    if not payloads:
+        return None
+    now = time.monotonic()
+    # Drop anything that was validated but never set up (e.g. aborted flows)
+    for key in [k for k, (stored, _) in payloads.items() if now - stored > VALIDATION_HANDOFF_TTL]:
+        payloads.pop(key)
+    entry = payloads.pop(_key(latitude, longitude, lang), None)
+    return entry[1] if entry else None
@@ -0,0 +1,77 @@
+"""Met Alerts image platform: a locally rendered map of the active alerts."""
+from __future__ import annotations
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DEFAULT_NAME
+from .coordinator import MetAlertsCoordinator
+from .svg_map import MapStyle, SvgMapCache, geometry_hash
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Met Alerts map image from a config entry."""
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    name = entry.data.get(CONF_NAME, DEFAULT_NAME)
+    async_add_entities([MetAlertsMapImage(hass, coordinator, name, entry.entry_id)])
+
+
+class MetAlertsMapImage(CoordinatorEntity, ImageEntity):
+    """SVG map of the active alert polygons and the configured location.
+
+    The map is only rendered when the alert geometries, the location or the
+    style change; otherwise the cached SVG is returned.
+    """
+
+    _attr_content_type = "image/svg+xml"
+
+    def __init__(self, hass: HomeAssistant, coordinator: MetAlertsCoordinator, name: str, entry_id: str):
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, hass)
+        self._attr_name = f"{name} map"
+        self._attr_unique_id = f"{entry_id}_map"
+        self._attr_has_entity_name = False
+        self._style = MapStyle()
+        self._cache = SvgMapCache(max_entries=4)
+        self._shapes: list[tuple[dict, str]] = []
+        self._shapes_hash: str | None = None
+        self._update_shapes()
+
+    def _update_shapes(self) -> None:
+        """Collect alert geometries and hash them once per refresh."""
+        features = self.coordinator.data.get("features", []) if self.coordinator.data else []
+        shapes = []
+        for feature in features:
+            if not feature.get("geometry"):
+                continue
+            try:
+                _, color, _ = feature.get("properties", {}).get("awareness_level", "").split("; ")
+            except ValueError:
+                color = ""
+            shapes.append((feature["geometry"], color))
+        shapes_hash = geometry_hash(shapes)
+        if shapes_hash != self._shapes_hash:
+            self._attr_image_last_updated = dt_util.utcnow()
+        self._shapes = shapes
+        self._shapes_hash = shapes_hash
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_shapes()
+        super()._handle_coordinator_update()
+
+    async def async_image(self) -> bytes | None:
+        """Return the rendered SVG map."""
+        location = (self.coordinator.latitude, self.coordinator.longitude)
+        return await self.hass.async_add_executor_job(
+            self._cache.get, self._shapes, location, self._style, self._shapes_hash
+        )
@@ -0,0 +1,74 @@
+"""Sorted index of alert validity windows for range queries."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone, tzinfo
+
+
+class AlertIntervalIndex:
+    """Alert windows sorted by start time, updated incrementally.
+
+    Windows are given as ISO 8601 strings and are only parsed when an alert
+    is new or its window changed. Range queries bisect on the start time;
+    the longest window bounds how far back an overlapping alert can start.
+    """
+
+    def __init__(self, default_tz: tzinfo = timezone.utc):
+        self.default_tz = default_tz
+        # (start, key), sorted
+        self._starts: list[tuple[datetime, str]] = []
+        # key -> (raw window, parsed start, parsed end)
+        self._windows: dict[str, tuple[tuple[str, str], datetime, datetime]] = {}
+        self._max_duration = timedelta(0)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def _parse(self, value: str) -> datetime:
+        parsed = datetime.fromisoformat(value)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=self.default_tz)
+
+    def _remove(self, key: str) -> None:
+        _, start, end = self._windows.pop(key)
+        del self._starts[bisect_left(self._starts, (start, key))]
+        if end - start >= self._max_duration:
+            self._max_duration = max(
+                (e - s for _, s, e in self._windows.values()), default=timedelta(0)
+            )
+
+    def update(self, windows: dict[str, tuple[str | None, str | None]]) -> None:
+        """Make the index hold exactly these windows, keyed by alert id.
+
+        Alerts without a complete or parseable window are left out.
+        """
+        for key in [k for k, (raw, _, _) in self._windows.items() if windows.get(k) != raw]:
+            self._remove(key)
+        for key, raw in windows.items():
+            if key in self._windows or not raw[0] or not raw[1]:
+                continue
+            try:
+                start, end = self._parse(raw[0]), self._parse(raw[1])
+            except ValueError:
+                continue
+            self._windows[key] = (raw, start, end)
+            insort(self._starts, (start, key))
+            self._max_duration = max(self._max_duration, end - start)
+
+    def window(self, key: str) -> tuple[datetime, datetime]:
+        """Return the parsed window of an indexed alert."""
+        _, start, end = self._windows[key]
+        return start, end
+
+    def overlapping(self, start: datetime, end: datetime) -> list[str]:
+        """Return the keys of alerts whose window overlaps [start, end), by start time."""
+        lo = bisect_left(self._starts, (start - self._max_duration,))
+        hi = bisect_left(self._starts, (end,))
+        return [key for _, key in self._starts[lo:hi] if self._windows[key][2] > start]
+
+    def current_or_next(self, now: datetime) -> str | None:
+        """Return the earliest-starting alert that is active at or after now."""
+        lo = bisect_left(self._starts, (now - self._max_duration,))
+        for _, key in self._starts[lo:]:
+            if self._windows[key][2] > now:
+                return key
+        return None
@@ -0,0 +1,201 @@
+"""Local caching proxy for alert map images."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from hashlib import sha1
+from http import HTTPStatus
+import logging
+from pathlib import Path
+import time
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, MAP_CACHE_DEFAULT_TTL, MAP_CACHE_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+MAP_URL_PATH = "/api/met_alerts/map"
+MAP_CACHE_KEY = "map_cache"
+
+
+def map_expiry(valid_to: str | None) -> float:
+    """Return when a map stops being useful: the alert's end time, or a default."""
+    if valid_to:
+        try:
+            return datetime.fromisoformat(valid_to).timestamp()
+        except ValueError:
+            pass
+    return time.time() + MAP_CACHE_DEFAULT_TTL
+
+
+class MapImageCache:
+    """Size-bounded LRU disk cache of alert map images.
+
+    Each image is downloaded once per alert version. Files are named
+    ``<key>_<expiry>.png`` so that the index survives restarts, and expired
+    files are removed as they are found.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: Path, max_bytes: int):
+        self.hass = hass
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # key -> (path, size, expiry), least recently used first
+        self._files: OrderedDict[str, tuple[Path, int, float]] = OrderedDict()
+        # key -> (remote url, expiry) for maps referenced by current alerts
+        self._sources: dict[str, tuple[str, float]] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+        self._size = 0
+
+    def _load_index(self) -> None:
+        """Index files left by a previous run (executor)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        for path in sorted(self.directory.glob("*.png"), key=lambda p: p.stat().st_mtime):
+            try:
+                key, expiry = path.stem.rsplit("_", 1)
+                expiry = float(expiry)
+            except ValueError:
+                expiry = 0
+            if expiry <= now:
+                path.unlink(missing_ok=True)
+                continue
+            size = path.stat().st_size
+            self._files[key] = (path, size, expiry)
+            self._size += size
+
+    async def async_load(self) -> None:
+        """Load the index of cached files."""
+        await self.hass.async_add_executor_job(self._load_index)
+
+    def register(self, alert_id: str, url: str, valid_to: str | None) -> str:
+        """Allow a remote map to be served and return the local URL for it."""
+        key = sha1(f"{alert_id}|{url}".encode()).hexdigest()[:20]
+        now = time.time()
+        for stale in [k for k, (_, expiry) in self._sources.items() if expiry <= now]:
+            self._sources.pop(stale)
+        self._sources[key] = (url, map_expiry(valid_to))
+        return f"{MAP_URL_PATH}/{key}.png"
+
+    def _evict(self, incoming: int) -> list[Path]:
+        """Drop expired and least recently used entries to make room."""
+        now = time.time()
+        evicted = [k for k, (_, _, expiry) in self._files.items() if expiry <= now]
+        evicted_paths = [self._files.pop(k)[0] for k in evicted]
+        self._size = sum(size for _, size, _ in self._files.values())
+        while self._files and self._size + incoming > self.max_bytes:
+            path, size, _ = self._files.popitem(last=False)[1]
+            self._size -= size
+            evicted_paths.append(path)
+        return evicted_paths
+
+    @staticmethod
+    def _write(path: Path, data: bytes, evicted: list[Path]) -> None:
+        """Write a new image and delete evicted ones (executor)."""
+        for old in evicted:
+            old.unlink(missing_ok=True)
+        path.write_bytes(data)
+
+    async def _async_download(self, key: str, url: str, expiry: float) -> Path:
+        async with aiohttp.ClientSession() as session:
+            async with asyncio.timeout(10):
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        raise ValueError(f"Map download returned status {response.status}")
+                    data = await response.read()
+
+        evicted = []
+        if (previous := self._files.pop(key, None)) is not None:
+            evicted.append(previous[0])
+        evicted += self._evict(len(data))
+        path = self.directory / f"{key}_{int(expiry)}.png"
+        await self.hass.async_add_executor_job(self._write, path, data, evicted)
+        self._files[key] = (path, len(data), expiry)
+        self._size += len(data)
+        _LOGGER.debug("Cached map %s (%d bytes) from %s", key, len(data), url)
+        return path
+
+    async def async_get(self, key: str) -> tuple[Path, float] | None:
+        """Return the cached file and expiry for a key, downloading it if needed."""
+        cached = self._files.get(key)
+        if cached is not None and cached[2] > time.time():
+            self._files.move_to_end(key)
+            return cached[0], cached[2]
+        if key not in self._sources:
+            return None
+        url, expiry = self._sources[key]
+        # Concurrent requests for the same map share one download
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = self.hass.async_create_task(self._async_download(key, url, expiry))
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task), expiry
+
+
+class MetAlertsMapView(HomeAssistantView):
+    """Serve cached alert maps.
+
+    Maps are public images from MET Norway, and only maps referenced by
+    current alerts can be requested, so no authentication is required.
+    This lets dashboard <img> tags load them directly.
+    """
+
+    url = MAP_URL_PATH + "/{key}.png"
+    name = "api:met_alerts:map"
+    requires_auth = False
+
+    def __init__(self, cache: MapImageCache):
+        self.cache = cache
+
+    async def get(self, request: web.Request, key: str) -> web.StreamResponse:
+        """Return a cached map image."""
+        if request.headers.get("If-None-Match") == f'"{key}"':
+            return web.Response(status=HTTPStatus.NOT_MODIFIED)
+        try:
+            result = await self.cache.async_get(key)
+        except (aiohttp.ClientError, TimeoutError, ValueError, OSError) as err:
+            _LOGGER.warning("Could not fetch alert map %s: %s", key, err)
+            return web.Response(status=HTTPStatus.BAD_GATEWAY)
+        if result is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        path, expiry = result
+        max_age = max(int(expiry - time.time()), 0)
+        return web.FileResponse(
+            path,
+            headers={
+                "Content-Type": "image/png",
+                "Cache-Control": f"public, max-age={max_age}, immutable",
+                "ETag": f'"{key}"',
+            },
+        )
+
+
+async def _async_setup_map_cache(hass: HomeAssistant) -> MapImageCache:
+    cache = MapImageCache(hass, Path(hass.config.path(DOMAIN, "maps")), MAP_CACHE_MAX_BYTES)
+    await cache.async_load()
+    hass.http.register_view(MetAlertsMapView(cache))
+    return cache
+
+
+async def async_get_map_cache(hass: HomeAssistant) -> MapImageCache:
+    """Return the shared map cache.
+
+    The cache directory and its view are only created when the first entry
+    with local maps needs them; concurrent callers share the setup.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (setup := domain_data.get(MAP_CACHE_KEY)) is None:
+        setup = domain_data[MAP_CACHE_KEY] = hass.async_create_task(_async_setup_map_cache(hass))
+    try:
+        return await asyncio.shield(setup)
+    except OSError:
+        # Let the next caller try again
+        if domain_data.get(MAP_CACHE_KEY) is setup:
+            domain_data.pop(MAP_CACHE_KEY)
+        raise
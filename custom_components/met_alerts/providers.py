@@ -0,0 +1,274 @@
+"""Alert providers and the pipeline that combines them into unified alert records.
+
+Every provider returns records in the unified schema produced by
+``core.normalize_alert``.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import logging
+import time
+
+import aiohttp
+
+from .core import normalize_alert
+
+_LOGGER = logging.getLogger(__name__)
+
+VARSOM_AVALANCHE_URL = (
+    "https://api01.nve.no/hydrology/forecast/avalanche/v6.3.0/api"
+    "/AvalancheWarningByCoordinates/Simple/{lat}/{lon}/{lang}/{start}/{end}"
+)
+VARSOM_FLOOD_URL = (
+    "https://api01.nve.no/hydrology/forecast/flood/v1.0.10/api"
+    "/Warning/County/{county}/{lang}/{start}/{end}"
+)
+VARSOM_LANDSLIDE_URL = (
+    "https://api01.nve.no/hydrology/forecast/landslide/v1.0.6/api"
+    "/Warning/County/{county}/{lang}/{start}/{end}"
+)
+VARSOM_WEB_URL = "https://www.varsom.no/"
+VARSOM_LANG_KEYS = {"no": 1, "en": 2}
+# Varsom activity/danger level -> (color, severity_level on the MetAlerts scale)
+VARSOM_LEVELS = {
+    2: ("yellow", 2),
+    3: ("orange", 3),
+    4: ("red", 4),
+    5: ("red", 4),
+}
+
+
+class AlertProvider(ABC):
+    """Base class for a source of alerts."""
+
+    name = "provider"
+    # Seconds before the pipeline gives up on this provider for one cycle
+    timeout = 10.0
+
+    @abstractmethod
+    async def async_fetch(self) -> list[dict]:
+        """Return the current alerts as unified records."""
+
+
+class MetAlertsProvider(AlertProvider):
+    """MET Norway MetAlerts.
+
+    Fetching is delegated to a callable so that the coordinator keeps control
+    of validation handoff, fixture replay and test mode. The raw GeoJSON of
+    the last fetch is kept in ``payload`` for the legacy sensors. ``normalize``
+    lets the coordinator reuse records shared with other entries.
+    """
+
+    name = "met_alerts"
+    # The coordinator's own request times out after 10 seconds
+    timeout = 15.0
+
+    def __init__(
+        self,
+        fetch_payload: Callable[[], Awaitable[dict]],
+        normalize: Callable[[dict], dict] = normalize_alert,
+    ):
+        self._fetch_payload = fetch_payload
+        self.normalize = normalize
+        self.payload: dict = {}
+
+    async def async_fetch(self) -> list[dict]:
+        self.payload = await self._fetch_payload()
+        return [self.normalize(feature) for feature in self.payload.get("features", [])]
+
+
+class VarsomProvider(AlertProvider):
+    """NVE Varsom geohazard warnings (avalanche, flood and landslide).
+
+    Avalanche warnings are queried by coordinates. Flood and landslide
+    warnings are only published per county and are skipped without one.
+    """
+
+    name = "varsom"
+
+    def __init__(self, latitude: float, longitude: float, lang: str, county: str | None = None, days: int = 2):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.lang = VARSOM_LANG_KEYS.get(lang, 1)
+        self.county = county
+        self.days = days
+
+    async def async_fetch(self) -> list[dict]:
+        start = date.today()
+        params = {
+            "lat": self.latitude,
+            "lon": self.longitude,
+            "lang": self.lang,
+            "county": self.county,
+            "start": start.isoformat(),
+            "end": (start + timedelta(days=self.days)).isoformat(),
+        }
+        requests = [("avalanches", VARSOM_AVALANCHE_URL)]
+        if self.county:
+            requests += [("flood", VARSOM_FLOOD_URL), ("landslide", VARSOM_LANDSLIDE_URL)]
+
+        async with aiohttp.ClientSession() as session:
+            responses = await asyncio.gather(
+                *(self._async_get(session, url.format(**params)) for _, url in requests)
+            )
+
+        records = []
+        for (kind, _), warnings in zip(requests, responses):
+            for warning in warnings:
+                if (record := normalize_varsom_warning(kind, warning)) is not None:
+                    records.append(record)
+        return records
+
+    @staticmethod
+    async def _async_get(session: aiohttp.ClientSession, url: str) -> list[dict]:
+        async with session.get(url, headers={"Accept": "application/json"}) as response:
+            if response.status != 200:
+                raise ValueError(f"Varsom returned status {response.status} for {url}")
+            return await response.json(content_type=None) or []
+
+
+@dataclass
+class ProviderStats:
+    """Outcome of one provider in one pipeline run."""
+
+    latency: float
+    alerts: int
+    error: str | None = None
+    # True when the alerts are left over from an earlier successful run
+    stale: bool = False
+
+    def as_dict(self) -> dict:
+        return {
+            "latency_ms": round(self.latency * 1000),
+            "alerts": self.alerts,
+            "error": self.error,
+            "stale": self.stale,
+        }
+
+
+@dataclass
+class PipelineResult:
+    """Merged alerts keyed by alert id plus per-provider statistics."""
+
+    alerts: dict[str, dict] = field(default_factory=dict)
+    stats: dict[str, ProviderStats] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+class AlertPipeline:
+    """Fetch all providers concurrently and merge their records.
+
+    Each provider runs under its own timeout, so a slow or failing source
+    cannot hold up the others. Its last good records are reused instead.
+    """
+
+    def __init__(self, providers: Iterable[AlertProvider]):
+        self.providers = list(providers)
+        self._last: dict[str, list[dict]] = {}
+
+    async def _async_run_provider(self, provider: AlertProvider):
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(provider.timeout) as deadline:
+                alerts = await provider.async_fetch()
+        except Exception as err:  # pylint: disable=broad-except
+            # Only the pipeline's own deadline is reported as such; errors raised by the provider keep their text
+            if deadline.expired():
+                err = TimeoutError(f"{provider.name} timed out after {provider.timeout}s")
+            return provider, None, time.monotonic() - started, err
+        return provider, alerts, time.monotonic() - started, None
+
+    async def async_run(self) -> PipelineResult:
+        """Run one fetch cycle over all providers."""
+        outcomes = await asyncio.gather(*(self._async_run_provider(p) for p in self.providers))
+        result = PipelineResult()
+        collected = []
+        for provider, alerts, latency, err in outcomes:
+            if err is None:
+                self._last[provider.name] = alerts
+                result.stats[provider.name] = ProviderStats(latency, len(alerts))
+            else:
+                alerts = self._last.get(provider.name, [])
+                result.errors[provider.name] = err
+                result.stats[provider.name] = ProviderStats(latency, len(alerts), str(err) or repr(err), bool(alerts))
+                _LOGGER.warning("Alert provider %s failed: %s", provider.name, err)
+            _LOGGER.debug("Alert provider %s: %d alert(s) in %.3fs", provider.name, len(alerts), latency)
+            collected.extend(alerts)
+        result.alerts = merge_alerts(collected)
+        return result
+
+    def replace_alerts(self, name: str, alerts: list[dict]) -> dict[str, dict]:
+        """Replace one provider's last alerts and return the merged alerts of all providers."""
+        self._last[name] = alerts
+        return merge_alerts(
+            alert for provider in self.providers for alert in self._last.get(provider.name, [])
+        )
+
+
+def merge_alerts(records: Iterable[dict]) -> dict[str, dict]:
+    """Deduplicate records by id, keeping the most severe and the union of areas."""
+    merged: dict[str, dict] = {}
+    for record in records:
+        key = record["id"]
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = record
+            continue
+        base = record if record["severity_level"] > existing["severity_level"] else existing
+        areas = list(dict.fromkeys([*existing["areas"], *record["areas"]]))
+        merged[key] = {**base, "areas": areas} if areas != base["areas"] else base
+    return merged
+
+
+def normalize_varsom_warning(kind: str, warning: dict) -> dict | None:
+    """Convert a Varsom warning to a unified record, or None below yellow level."""
+    try:
+        level = int(warning.get("DangerLevel") or warning.get("ActivityLevel") or 0)
+    except ValueError:
+        return None
+    if level not in VARSOM_LEVELS:
+        return None
+    color, severity_level = VARSOM_LEVELS[level]
+
+    if region := warning.get("RegionName"):
+        areas = [region]
+    else:
+        areas = [m.get("Name", "") for m in warning.get("MunicipalityList") or [] if m.get("Name")]
+    valid_from = warning.get("ValidFrom")
+    valid_to = warning.get("ValidTo")
+    warning_id = warning.get("RegId") or warning.get("Id") or warning.get("MasterId") or ""
+    main_text = warning.get("MainText", "")
+
+    return {
+        "title": main_text,
+        "starttime": valid_from,
+        "endtime": valid_to,
+        "description": warning.get("WarningText") or warning.get("AvalancheDanger") or "",
+        "awareness_level": f"{level}; {color}",
+        "awareness_level_numeric": str(level),
+        "awareness_level_color": color,
+        "certainty": "",
+        "severity": "",
+        "instruction": warning.get("AdviceText") or "",
+        "contact": VARSOM_WEB_URL,
+        "resources": [],
+        "area": ", ".join(areas),
+        "event_awareness_name": "",
+        "consequences": warning.get("ConsequenceText") or "",
+        "map_url": None,
+        "id": f"varsom:{kind}:{warning_id}:{valid_from}",
+        "source": "varsom",
+        "alert_category": "geohazard",
+        "alert_type": kind,
+        "severity_level": severity_level,
+        "severity_color": color,
+        "severity_name": "",
+        "valid_from": valid_from,
+        "valid_to": valid_to,
+        "areas": areas,
+        "url": VARSOM_WEB_URL,
+    }
@@ -0,0 +1,90 @@
+"""Reference-counted alert features shared by all config entries."""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from hashlib import sha1
+import json
+
+from .core import alert_id, normalize_alert
+
+ALERT_REGISTRY_KEY = "alert_registry"
+
+
+class _Entry:
+    __slots__ = ("feature", "record", "refs")
+
+    def __init__(self, feature: dict):
+        self.feature = feature
+        self.record: dict | None = None
+        self.refs = 0
+
+
+class AlertRegistry:
+    """Intern alert features by alert id and version across coordinators.
+
+    A regional alert covering many configured locations is stored once, and
+    normalized once, instead of once per entry. Each owner (a coordinator)
+    references the alerts of its latest payload; an alert is freed when no
+    owner references it any more.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        # id() of each interned feature -> its key, to find records without hashing again
+        self._keys: dict[int, tuple[str, str]] = {}
+        self._owners: dict[Hashable, set[tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def version(feature: dict) -> str:
+        """Return a fingerprint of a feature's properties.
+
+        A changed alert is republished with new properties, so this tells
+        versions of the same alert id apart.
+        """
+        properties = json.dumps(feature.get("properties", {}), sort_keys=True, separators=(",", ":"))
+        return sha1(properties.encode()).hexdigest()
+
+    def intern(self, owner: Hashable, features: list[dict]) -> list[dict]:
+        """Return the shared instances of these features and make owner reference exactly them."""
+        keys = set()
+        shared = []
+        for feature in features:
+            key = (alert_id(feature), self.version(feature))
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(feature)
+                self._keys[id(feature)] = key
+            shared.append(entry.feature)
+            keys.add(key)
+        self._set_references(owner, keys)
+        return shared
+
+    def release(self, owner: Hashable) -> None:
+        """Drop all references held by owner."""
+        self._set_references(owner, set())
+        self._owners.pop(owner, None)
+
+    def _set_references(self, owner: Hashable, keys: set[tuple[str, str]]) -> None:
+        previous = self._owners.get(owner, set())
+        for key in keys - previous:
+            self._entries[key].refs += 1
+        for key in previous - keys:
+            entry = self._entries[key]
+            entry.refs -= 1
+            if entry.refs <= 0:
+                del self._entries[key]
+                del self._keys[id(entry.feature)]
+        self._owners[owner] = keys
+
+    def record(self, feature: dict) -> dict:
+        """Return the normalized record of a feature, shared if the feature is interned."""
+        key = self._keys.get(id(feature))
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None or entry.feature is not feature:
+            return normalize_alert(feature)
+        if entry.record is None:
+            entry.record = normalize_alert(feature)
+        return entry.record
@@ -1,12 +1,8 @@
 """Met Alerts sensor platform."""
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import timedelta
-import re
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
@@ -15,11 +11,7 @@ from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -29,15 +21,13 @@ from .const import (
     CONF_SENSOR_MODE,
     SENSOR_MODE_LEGACY,
     SENSOR_MODE_ARRAY,
-    CONF_TEST_MODE,
-    ICON_DATA_URLS,
     ICON_ATTRIBUTION,
 )
+from .coordinator import SCAN_INTERVAL, MetAlertsCoordinator
+from .core import LEGACY_FIELDS, icon_url, sort_features
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=30)
-
 # Support for legacy YAML configuration
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_NAME, default=DEFAULT_NAME): cv.string,
@@ -55,28 +45,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up Met Alerts sensor from a config entry."""
     name = entry.data.get(CONF_NAME, DEFAULT_NAME)
-    latitude = entry.data.get(CONF_LATITUDE)
-    longitude = entry.data.get(CONF_LONGITUDE)
-    lang = entry.data.get(CONF_LANG, DEFAULT_LANG)
     # Read sensor mode from options, fallback to legacy
     sensor_mode = entry.options.get(CONF_SENSOR_MODE, SENSOR_MODE_LEGACY) if hasattr(entry, 'options') else SENSOR_MODE_LEGACY
-    test_mode = entry.options.get(CONF_TEST_MODE, False) if hasattr(entry, 'options') else False
 
-    coordinator = MetAlertsCoordinator(hass, latitude, longitude, lang, test_mode)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator: MetAlertsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(build_sensors(coordinator, name, entry.entry_id, sensor_mode))
 
-    entities = []
+
+def build_sensors(
+    coordinator: MetAlertsCoordinator, name: str, entry_id: str, sensor_mode: str
+) -> list[SensorEntity]:
+    """Create the sensor entities for a sensor mode."""
     if sensor_mode == SENSOR_MODE_ARRAY:
-        entities.append(MetAlertsArraySensor(coordinator, name, entry.entry_id))
-    else:
-        # Default: legacy mode (4 sensors)
-        entities = [
-            MetAlertsSensor(coordinator, f"{name}", 0, entry.entry_id),
-            MetAlertsSensor(coordinator, f"{name}_2", 1, entry.entry_id),
-            MetAlertsSensor(coordinator, f"{name}_3", 2, entry.entry_id),
-            MetAlertsSensor(coordinator, f"{name}_4", 3, entry.entry_id),
-        ]
-    async_add_entities(entities)
+        return [MetAlertsArraySensor(coordinator, name, entry_id)]
+    # Default: legacy mode (4 sensors)
+    return [
+        MetAlertsSensor(coordinator, f"{name}", 0, entry_id),
+        MetAlertsSensor(coordinator, f"{name}_2", 1, entry_id),
+        MetAlertsSensor(coordinator, f"{name}_3", 2, entry_id),
+        MetAlertsSensor(coordinator, f"{name}_4", 3, entry_id),
+    ]
 
 # New: Array mode sensor (single entity with all alerts as attribute)
 class MetAlertsArraySensor(CoordinatorEntity, SensorEntity):
@@ -94,98 +82,28 @@ class MetAlertsArraySensor(CoordinatorEntity, SensorEntity):
         """Return the state: number of active alerts, or 'No Alert'."""
         if not self.coordinator.data:
             return "No Alert"
-        features = self.coordinator.data.get("features", [])
-        return len(features) if features else "No Alert"
+        alerts = self.coordinator.alerts
+        return len(alerts) if alerts else "No Alert"
 
     @property
     def extra_state_attributes(self):
         """Return all alerts as an array attribute."""
         if not self.coordinator.data:
             return {"alerts": []}
-        features = self.coordinator.data.get("features", [])
-        alerts = []
-        for feature in features:
-            props = feature.get("properties", {})
-            title, starttime, endtime = extract_times_from_title(props.get("title", ""))
-            awareness_level = props.get("awareness_level", "")
-            try:
-                awareness_level_numeric, awareness_level_color, _ = awareness_level.split("; ")
-            except ValueError:
-                awareness_level_numeric = ""
-                awareness_level_color = ""
-            
-            # Get resource URL for unified schema
-            resource_url = ""
-            resources = props.get("resources", [])
-            if resources and len(resources) > 0:
-                resource_url = resources[0].get("uri", "")
-            
-            # Extract PNG map URL (for inline image display)
-            map_url = None
-            for resource in resources:
-                if resource.get("mimeType") == "image/png":
-                    map_url = resource.get("uri")
-                    break
-            
-            # Parse numeric severity level
-            severity_level = int(awareness_level_numeric) if awareness_level_numeric else 1
-            
-            alerts.append({
-                # ===== EXISTING FIELDS (backward compatibility) =====
-                "title": title,
-                "starttime": starttime,
-                "endtime": endtime,
-                "description": props.get("description", ""),
-                "awareness_level": awareness_level,
-                "awareness_level_numeric": awareness_level_numeric,
-                "awareness_level_color": awareness_level_color,
-                "certainty": props.get("certainty", ""),
-                "severity": props.get("severity", ""),
-                "instruction": props.get("instruction", ""),
-                "contact": props.get("contact", ""),
-                "resources": resources,
-                "area": props.get("area", ""),
-                "event_awareness_name": props.get("eventAwarenessName", ""),
-                "consequences": props.get("consequences", ""),
-                "map_url": map_url,
-                
-                # ===== UNIFIED SCHEMA FIELDS (for cross-integration compatibility) =====
-                "source": "met_alerts",                           # Integration identifier
-                "alert_category": "weather",                      # Category: weather/geohazard
-                "alert_type": props.get("event", ""),            # Alert type: gale, rain, snow, etc.
-                "severity_level": severity_level,                 # Numeric level 1-3 (Yellow=1, Orange=2, Red=3)
-                "severity_color": awareness_level_color,          # Color: yellow, orange, red
-                "severity_name": props.get("severity", ""),      # Name: Moderate, Severe, Extreme
-                "valid_from": starttime,                          # ISO8601 start time (alias for starttime)
-                "valid_to": endtime,                              # ISO8601 end time (alias for endtime)
-                "areas": [props.get("area", "")] if props.get("area") else [],  # Array of affected areas
-                "url": resource_url,                              # Link to detailed information
-            })
-        return {"alerts": alerts}
+        # Alerts are normalized once per refresh by the coordinator
+        return {"alerts": list(self.coordinator.alerts.values())}
 
     @property
     def entity_picture(self):
         """Return the icon for the most severe alert (if any)."""
         if not self.coordinator.data:
             return None
-        features = self.coordinator.data.get("features", [])
-        if not features:
+        alerts = self.coordinator.alerts
+        if not alerts:
             return None
-        # Use the first alert (highest awareness_level after sorting)
-        sorted_features = sorted(
-            features,
-            key=lambda x: x["properties"]["awareness_level"],
-            reverse=True,
-        )
-        props = sorted_features[0].get("properties", {})
-        event = props.get("event", "").lower().replace(" ", "-")
-        awareness_level = props.get("awareness_level", "")
-        try:
-            _, color, _ = awareness_level.split("; ")
-        except ValueError:
-            color = ""
-        key = f"{event}-{color.lower()}" if color else event
-        return ICON_DATA_URLS.get(key)
+        # Use the most severe alert from any provider
+        alert = max(alerts.values(), key=lambda a: a["severity_level"])
+        return icon_url(alert["alert_type"], alert["severity_color"])
 
     @property
     def attribution(self):
@@ -204,7 +122,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     longitude = config[CONF_LONGITUDE]
     lang = config.get(CONF_LANG, DEFAULT_LANG)
     
-    coordinator = MetAlertsCoordinator(hass, latitude, longitude, lang)
+    coordinator = MetAlertsCoordinator(hass, latitude=latitude, longitude=longitude, lang=lang)
     await coordinator.async_refresh()
     
     entities = [
@@ -216,167 +134,6 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     async_add_entities(entities)
 
 
-class MetAlertsCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Met Alerts data."""
-
-    def __init__(self, hass, latitude, longitude, lang, test_mode=False):
-        """Initialize coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
-        )
-        self.latitude = latitude
-        self.longitude = longitude
-        self.lang = lang
-        self.test_mode = test_mode
-
-    async def _async_update_data(self):
-        """Fetch data from API."""
-        url = f"https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0/current.json?lat={self.latitude}&lon={self.longitude}&lang={self.lang}"
-        #url = f"https://api.met.no/weatherapi/metalerts/2.0/example.json?lang={self.lang}"
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with asyncio.timeout(10):
-                    async with session.get(url) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching data: %s", response.status)
-                            raise UpdateFailed(f"Error fetching data: {response.status}")
-
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" not in content_type:
-                            _LOGGER.error("Unexpected Content-Type: %s", content_type)
-                            raise UpdateFailed(f"Unexpected Content-Type: {content_type}")
-
-                        response_text = await response.text()
-                        if not response_text:
-                            _LOGGER.error("Received empty response")
-                            raise UpdateFailed("Received empty response")
-
-                        try:
-                            json_data = await response.json()
-                            _LOGGER.info("Successfully fetched Met alerts data")
-                            _LOGGER.debug("Full API response: %s", json_data)
-                            
-                            # Inject test alerts if test mode is enabled
-                            if self.test_mode:
-                                test_features = [
-                                    {
-                                        "type": "Feature",
-                                        "geometry": {
-                                            "type": "Polygon",
-                                            "coordinates": [[
-                                                [5.5, 59.0], [5.5, 60.0], [7.0, 60.0], [7.0, 59.0], [5.5, 59.0]
-                                            ]]
-                                        },
-                                        "when": {
-                                            "interval": ["2025-12-16T00:00:00+00:00", "2025-12-17T23:59:59+00:00"]
-                                        },
-                                        "properties": {
-                                            "area": "Testville",
-                                            "awarenessResponse": "Monitor",
-                                            "awareness_level": "2; orange; Moderate",
-                                            "awareness_level_numeric": 2,
-                                            "awareness_level_color": "#FF9D00",
-                                            "awareness_type": "1; Wind",
-                                            "ceiling": None,
-                                            "certainty": "Likely",
-                                            "consequences": "Danger to life and property. Moderate damages to infrastructure. Travelling may be impossible.",
-                                            "contact": "https://www.met.no/en",
-                                            "county": ["Vestland"],
-                                            "description": "Strong gale or storm from southwest, Thursday afternoon and evening. Exposed coastal areas in Testville may experience wind gusts up to 35 m/s.",
-                                            "event": "gale",
-                                            "eventAwarenessName": "moderate-wind",
-                                            "eventEndingTime": "2025-12-17T23:59:59+00:00",
-                                            "geographicDomain": "land",
-                                            "id": "2.49.0.1.578.0.20251216120000000.1",
-                                            "instruction": "Stay indoors. Secure loose objects. Avoid unnecessary travel.",
-                                            "resources": [
-                                                {"mimeType": "text/html", "uri": "https://www.met.no/vaer-og-klima/ekstremvaervarsler-og-andre-farevarsler"}
-                                            ],
-                                            "riskMatrixColor": "Orange",
-                                            "severity": "Moderate",
-                                            "title": "Orange wind warning for Testville",
-                                            "triggerLevel": None,
-                                            "type": "Alert",
-                                            "web": "https://www.met.no/"
-                                        }
-                                    },
-                                    {
-                                        "type": "Feature",
-                                        "geometry": {
-                                            "type": "Polygon",
-                                            "coordinates": [[
-                                                [5.5, 59.0], [5.5, 60.0], [7.0, 60.0], [7.0, 59.0], [5.5, 59.0]
-                                            ]]
-                                        },
-                                        "when": {
-                                            "interval": ["2025-12-17T12:00:00+00:00", "2025-12-18T06:00:00+00:00"]
-                                        },
-                                        "properties": {
-                                            "area": "Testville",
-                                            "awarenessResponse": "Monitor",
-                                            "awareness_level": "3; red; Severe",
-                                            "awareness_level_numeric": 3,
-                                            "awareness_level_color": "#C60000",
-                                            "awareness_type": "6; Rain",
-                                            "ceiling": None,
-                                            "certainty": "Likely",
-                                            "consequences": "Danger to life and property. Extensive flooding expected. Roads may be closed. Power outages likely.",
-                                            "contact": "https://www.met.no/en",
-                                            "county": ["Vestland"],
-                                            "description": "Extreme rainfall expected in Testville region Friday afternoon and night. 150-200mm of rain in 24 hours. Rivers may overflow.",
-                                            "event": "rain",
-                                            "eventAwarenessName": "extreme-rain",
-                                            "eventEndingTime": "2025-12-18T06:00:00+00:00",
-                                            "geographicDomain": "land",
-                                            "id": "2.49.0.1.578.0.20251216120000000.2",
-                                            "instruction": "Do not travel unless essential. Stay away from rivers and streams. Follow local authority instructions.",
-                                            "resources": [
-                                                {"mimeType": "text/html", "uri": "https://www.met.no/vaer-og-klima/ekstremvaervarsler-og-andre-farevarsler"}
-                                            ],
-                                            "riskMatrixColor": "Red",
-                                            "severity": "Severe",
-                                            "title": "Red rain warning for Testville",
-                                            "triggerLevel": None,
-                                            "type": "Alert",
-                                            "web": "https://www.met.no/"
-                                        }
-                                    }
-                                ]
-                                
-                                # Initialize features if not present
-                                if "features" not in json_data:
-                                    json_data["features"] = []
-                                
-                                # Add test features
-                                json_data["features"].extend(test_features)
-                                _LOGGER.info("Test mode: Injected 2 fake alerts for Testville (Orange Wind + Red Rain)")
-                            
-                            # Log the number of features found
-                            features = json_data.get("features", [])
-                            _LOGGER.info("Found %d alert(s) in response", len(features))
-                            
-                            # Log details of each alert
-                            for idx, feature in enumerate(features):
-                                props = feature.get("properties", {})
-                                _LOGGER.info(
-                                    "Alert %d: event='%s', awareness_level='%s', title='%s'",
-                                    idx + 1,
-                                    props.get("event"),
-                                    props.get("awareness_level"),
-                                    props.get("title"),
-                                )
-                            
-                            return json_data
-                        except aiohttp.ClientResponseError as err:
-                            _LOGGER.error("JSON decode error: Response content was empty or invalid")
-                            _LOGGER.debug("Response content: %s", response_text)
-                            raise UpdateFailed(f"JSON decode error: {err}")
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(f"Error fetching data: {err}")
-
 class MetAlertsSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Met Alerts sensor."""
 
@@ -389,64 +146,34 @@ class MetAlertsSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{entry_id}_{index}" if entry_id else None
         self._attr_has_entity_name = False
 
+    def _feature(self) -> dict | None:
+        """Return the alert feature at this sensor's index, by awareness level."""
+        if not self.coordinator.data:
+            return None
+        sorted_features = sort_features(self.coordinator.data.get("features", []))
+        if len(sorted_features) > self.index:
+            return sorted_features[self.index]
+        return None
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if not self.coordinator.data:
+        feature = self._feature()
+        if feature is None:
+            _LOGGER.debug("Sensor %s (index %d): No alert available", self._attr_name, self.index)
             return "No Alert"
-            
-        features = self.coordinator.data.get("features", [])
-        
-        _LOGGER.debug(
-            "Sensor %s (index %d): Processing %d features",
-            self._attr_name,
-            self.index,
-            len(features),
-        )
-
-        # Sort features by awareness_level
-        sorted_features = sorted(
-            features,
-            key=lambda x: x["properties"]["awareness_level"],
-            reverse=True,
-        )
-
-        if len(sorted_features) > self.index:
-            alert = sorted_features[self.index]
-            properties = alert["properties"]
-            event = properties.get("event", "No Alert")
-            _LOGGER.debug("Sensor %s: Alert found - %s", self._attr_name, event)
-            return event
-        
-        _LOGGER.debug(
-            "Sensor %s (index %d): No alert available",
-            self._attr_name,
-            self.index,
-        )
-        return "No Alert"
+        event = feature["properties"].get("event", "No Alert")
+        _LOGGER.debug("Sensor %s: Alert found - %s", self._attr_name, event)
+        return event
 
     @property
     def entity_picture(self):
         """Return the icon image for the alert (if any)."""
-        if not self.coordinator.data:
+        feature = self._feature()
+        if feature is None:
             return None
-        features = self.coordinator.data.get("features", [])
-        sorted_features = sorted(
-            features,
-            key=lambda x: x["properties"]["awareness_level"],
-            reverse=True,
-        )
-        if len(sorted_features) > self.index:
-            properties = sorted_features[self.index]["properties"]
-            event = properties.get("event", "").lower().replace(" ", "-")
-            awareness_level = properties.get("awareness_level", "")
-            try:
-                _, color, _ = awareness_level.split("; ")
-            except ValueError:
-                color = ""
-            key = f"{event}-{color.lower()}" if color else event
-            return ICON_DATA_URLS.get(key)
-        return None
+        alert = self.coordinator.registry.record(feature)
+        return icon_url(alert["alert_type"], alert["awareness_level_color"])
 
     @property
     def attribution(self):
@@ -456,73 +183,15 @@ class MetAlertsSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        if not self.coordinator.data:
+        feature = self._feature()
+        if feature is None:
             return {}
-            
-        features = self.coordinator.data.get("features", [])
-        
-        # Sort features by awareness_level
-        sorted_features = sorted(
-            features,
-            key=lambda x: x["properties"]["awareness_level"],
-            reverse=True,
-        )
-
-        if len(sorted_features) > self.index:
-            alert = sorted_features[self.index]
-            properties = alert["properties"]
-
-            # Extract starttime and endtime from the title
-            title, starttime, endtime = extract_times_from_title(
-                properties.get("title", "")
-            )
-
-            # Extract the URL of the PNG image
-            resources = properties.get("resources", [])
-            map_url = None
-            for resource in resources:
-                if resource.get("mimeType") == "image/png":
-                    map_url = resource.get("uri")
-                    break
-
-            # Split awareness_level into numeric, color, and name
-            awareness_level = properties.get("awareness_level", "")
-            try:
-                awareness_level_numeric, awareness_level_color, _ = awareness_level.split("; ")
-            except ValueError:
-                awareness_level_numeric = ""
-                awareness_level_color = ""
-
-            return {
-                "title": title,
-                "starttime": starttime,
-                "endtime": endtime,
-                "description": properties.get("description", ""),
-                "awareness_level": properties.get("awareness_level", ""),
-                "awareness_level_numeric": awareness_level_numeric,
-                "awareness_level_color": awareness_level_color,
-                "certainty": properties.get("certainty", ""),
-                "severity": properties.get("severity", ""),
-                "instruction": properties.get("instruction", ""),
-                "contact": properties.get("contact", ""),
-                "resources": properties.get("resources", []),
-                "area": properties.get("area", ""),
-                "event_awareness_name": properties.get("eventAwarenessName", ""),
-                "consequences": properties.get("consequences", ""),
-                "map_url": map_url,
-            }
-        
-        return {}
-
-def extract_times_from_title(title: str) -> tuple[str, str | None, str | None]:
-    """Extract timestamps from alert title."""
-    timestamps = re.findall(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\+\d{2}:\d{2}", title)
-
-    if len(timestamps) >= 2:
-        starttime = timestamps[0]
-        endtime = timestamps[1]
-        # Remove the timestamps from the title
-        title = title.replace(starttime, "").replace(endtime, "").strip(", ").strip()
-        return title, starttime, endtime
-    else:
-        return title, None, None
+        alert = self.coordinator.registry.record(feature)
+        attributes = {field: alert[field] for field in LEGACY_FIELDS}
+        if "translations" in alert:
+            attributes["translations"] = alert["translations"]
+        # Prefer the coordinator's map URL, which may point at the local map cache
+        normalized = self.coordinator.alerts.get(alert["id"])
+        if normalized is not None:
+            attributes["map_url"] = normalized["map_url"]
+        return attributes
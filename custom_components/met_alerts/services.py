@@ -0,0 +1,61 @@
+"""Met Alerts services."""
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .bulk_import import async_register_import_service
+from .const import DOMAIN
+from .coordinator import MetAlertsCoordinator
+
+SERVICE_REFRESH = "refresh"
+ATTR_ENTRY_ID = "entry_id"
+
+REFRESH_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string])})
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the Met Alerts services."""
+    async_register_import_service(hass)
+
+    async def handle_refresh(call: ServiceCall) -> ServiceResponse:
+        """Refresh one, several or all entries and return their alert counts.
+
+        Each coordinator coalesces concurrent calls and skips the refresh if
+        its last one is more recent than its minimum interval.
+        """
+        coordinators = {
+            entry_id: coordinator
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+            if isinstance(coordinator, MetAlertsCoordinator)
+        }
+        entry_ids = call.data.get(ATTR_ENTRY_ID) or list(coordinators)
+        if unknown := [entry_id for entry_id in entry_ids if entry_id not in coordinators]:
+            raise ServiceValidationError(f"Unknown Met Alerts entries: {', '.join(unknown)}")
+        refreshed = await asyncio.gather(
+            *(coordinators[entry_id].async_refresh_on_demand() for entry_id in entry_ids)
+        )
+        return {
+            "entries": {
+                entry_id: {
+                    "alerts": len(coordinators[entry_id].alerts),
+                    "refreshed": ran,
+                    "success": coordinators[entry_id].last_update_success,
+                }
+                for entry_id, ran in zip(entry_ids, refreshed)
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        handle_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
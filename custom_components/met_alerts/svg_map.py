@@ -0,0 +1,153 @@
+"""Render alert polygons and a location as a simplified SVG map."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from hashlib import sha1
+import json
+import math
+
+SEVERITY_FILLS = {
+    "yellow": "#FFCC00",
+    "orange": "#FF9D00",
+    "red": "#C60000",
+}
+DEFAULT_FILL = "#888888"
+
+
+@dataclass(frozen=True)
+class MapStyle:
+    """Output size and colors of a rendered map."""
+
+    width: int = 400
+    height: int = 400
+    background: str = "#E8EEF2"
+    fill_opacity: float = 0.45
+    stroke_width: float = 1.5
+    marker_color: str = "#1565C0"
+    marker_radius: float = 5
+
+
+def simplify(points: Sequence[Sequence[float]], tolerance: float) -> list[Sequence[float]]:
+    """Simplify a polyline with the Douglas-Peucker algorithm.
+
+    Points closer than ``tolerance`` to the simplified line are dropped. The
+    first and last point are always kept, so closed rings stay closed.
+    """
+    if len(points) < 3 or tolerance <= 0:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first][:2], points[last][:2]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        max_dist, index = 0.0, first
+        for i in range(first + 1, last):
+            px, py = points[i][:2]
+            if length:
+                dist = abs(dy * px - dx * py + x2 * y1 - y2 * x1) / length
+            else:
+                dist = math.hypot(px - x1, py - y1)
+            if dist > max_dist:
+                max_dist, index = dist, i
+        if max_dist > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def _rings(geometry: dict) -> list[list[list[float]]]:
+    """Return all rings of a Polygon or MultiPolygon geometry."""
+    if not geometry:
+        return []
+    if geometry.get("type") == "Polygon":
+        return list(geometry.get("coordinates", []))
+    if geometry.get("type") == "MultiPolygon":
+        return [ring for polygon in geometry.get("coordinates", []) for ring in polygon]
+    return []
+
+
+def geometry_hash(shapes: Sequence[tuple[dict, str]]) -> str:
+    """Return a stable hash of (geometry, color) pairs."""
+    return sha1(json.dumps(shapes, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def render_svg(shapes: Sequence[tuple[dict, str]], location: tuple[float, float], style: MapStyle = MapStyle()) -> str:
+    """Render (geometry, severity color) pairs and a (lat, lon) marker as SVG.
+
+    Uses an equirectangular projection scaled by cos(latitude), which is
+    accurate enough for the extent of an alert area. Rings are simplified
+    to half a pixel at the output size.
+    """
+    lat0, lon0 = location
+    rings = [(ring, color) for geometry, color in shapes for ring in _rings(geometry)]
+    kx = math.cos(math.radians(lat0))
+
+    xs = [lon0 * kx] + [p[0] * kx for ring, _ in rings for p in ring]
+    ys = [lat0] + [p[1] for ring, _ in rings for p in ring]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    # Pad the extent by 10%, and show at least ~0.5 degrees around the location
+    span = max(max_x - min_x, max_y - min_y, 0.5) * 1.1
+    cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+    scale = min(style.width, style.height) / span
+    tolerance = 0.5 / scale
+
+    def project(x: float, y: float) -> tuple[float, float]:
+        return style.width / 2 + (x - cx) * scale, style.height / 2 - (y - cy) * scale
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{style.width}" height="{style.height}" '
+        f'viewBox="0 0 {style.width} {style.height}">',
+        f'<rect width="100%" height="100%" fill="{style.background}"/>',
+    ]
+    for ring, color in rings:
+        projected = simplify([(p[0] * kx, p[1]) for p in ring], tolerance)
+        if len(projected) < 3:
+            continue
+        path = "M" + " L".join("%.1f %.1f" % project(x, y) for x, y in projected) + " Z"
+        fill = SEVERITY_FILLS.get(color.lower(), DEFAULT_FILL)
+        parts.append(
+            f'<path d="{path}" fill="{fill}" fill-opacity="{style.fill_opacity}" '
+            f'stroke="{fill}" stroke-width="{style.stroke_width}"/>'
+        )
+    marker_x, marker_y = project(lon0 * kx, lat0)
+    parts.append(
+        f'<circle cx="{marker_x:.1f}" cy="{marker_y:.1f}" r="{style.marker_radius}" '
+        f'fill="{style.marker_color}" stroke="#FFFFFF" stroke-width="2"/>'
+    )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+class SvgMapCache:
+    """LRU cache of rendered maps keyed by geometry hash, location and style."""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._cache: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def get(
+        self,
+        shapes: Sequence[tuple[dict, str]],
+        location: tuple[float, float],
+        style: MapStyle = MapStyle(),
+        shapes_hash: str | None = None,
+    ) -> bytes:
+        """Return the rendered map, rendering only on a cache miss.
+
+        Pass ``shapes_hash`` when the caller already knows it, to skip hashing.
+        """
+        key = (shapes_hash or geometry_hash(shapes), location, style)
+        if (svg := self._cache.get(key)) is not None:
+            self._cache.move_to_end(key)
+            return svg
+        svg = render_svg(shapes, location, style).encode()
+        self._cache[key] = svg
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return svg
@@ -0,0 +1,26 @@
+"""Severity and event type thresholds for the threshold binary sensors."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from .const import SEVERITY_THRESHOLDS
+
+
+def threshold_keys(severity_thresholds: Iterable[str], event_thresholds: Iterable[str]) -> list[str]:
+    """Return the keys of the threshold binary sensors for the configured thresholds."""
+    return [f"severity_{color}" for color in severity_thresholds] + [f"event_{event}" for event in event_thresholds]
+
+
+def evaluate_thresholds(
+    alerts: Iterable[dict], severity_thresholds: Sequence[str], event_thresholds: Sequence[str]
+) -> dict[str, bool]:
+    """Return whether each threshold is met, keyed by threshold key.
+
+    Severity thresholds are met by an alert of their color or a worse one.
+    """
+    alerts = list(alerts)
+    max_rank = max((SEVERITY_THRESHOLDS.get(str(alert["severity_color"]).lower(), 0) for alert in alerts), default=0)
+    events = {alert["alert_type"] for alert in alerts}
+    states = [max_rank >= SEVERITY_THRESHOLDS[color] for color in severity_thresholds]
+    states += [event in events for event in event_thresholds]
+    return dict(zip(threshold_keys(severity_thresholds, event_thresholds), states))
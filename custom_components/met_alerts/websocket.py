@@ -0,0 +1,87 @@
+"""Websocket API for Met Alerts dashboard cards."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED
+from .coordinator import MetAlertsCoordinator
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Met Alerts websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def diff_alerts(previous: dict[str, dict], current: dict[str, dict]) -> dict[str, Any]:
+    """Return the added, updated and removed alerts between two snapshots."""
+    added = {}
+    updated = {}
+    for key, alert in current.items():
+        old = previous.get(key)
+        if old is None:
+            added[key] = alert
+        elif old is not alert and old != alert:
+            updated[key] = alert
+    removed = [key for key in previous if key not in current]
+    return {"added": added, "updated": updated, "removed": removed}
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "met_alerts/subscribe",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a snapshot of an entry's alerts, then push deltas keyed by alert id.
+
+    The subscription ends with an ``entry_unloaded`` error when the entry is
+    unloaded or reloaded, so cards know to subscribe again.
+    """
+    coordinator = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if not isinstance(coordinator, MetAlertsCoordinator):
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Met Alerts entry not found")
+        return
+
+    sent = coordinator.alerts
+
+    @callback
+    def forward_delta() -> None:
+        """Send only what changed since the last message to this client."""
+        nonlocal sent
+        current = coordinator.alerts
+        delta = diff_alerts(sent, current)
+        sent = current
+        if delta["added"] or delta["updated"] or delta["removed"]:
+            connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    @callback
+    def unsubscribe() -> None:
+        remove_listener()
+        disconnect()
+
+    @callback
+    def entry_unloaded() -> None:
+        """End the subscription; the reloaded entry has a new coordinator."""
+        if connection.subscriptions.pop(msg["id"], None) is None:
+            return
+        unsubscribe()
+        connection.send_error(msg["id"], "entry_unloaded", "Met Alerts entry was unloaded")
+
+    remove_listener = coordinator.async_add_listener(forward_delta)
+    disconnect = async_dispatcher_connect(hass, SIGNAL_ENTRY_UNLOADED.format(msg["entry_id"]), entry_unloaded)
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {"snapshot": sent}))
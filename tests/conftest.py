@@ -0,0 +1,15 @@
+"""Load the integration's Home Assistant independent modules for the tests.
+
+The package's ``__init__`` sets up the Home Assistant integration, so the
+modules are imported through a bare ``met_alerts`` package instead.
+"""
+from pathlib import Path
+import sys
+import types
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "met_alerts"
+
+if "met_alerts" not in sys.modules:
+    package = types.ModuleType("met_alerts")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["met_alerts"] = package
@@ -0,0 +1,43 @@
+"""Tests for geohash cells and the per-cell payload cache."""
+from met_alerts.geocell import CellCache, geohash
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_geohash():
+    assert geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_cell_cache_expires_and_honours_max_age():
+    clock = FakeClock()
+    cache = CellCache(ttl=10, clock=clock)
+    cache.put("u4pru", {"features": []})
+    clock.now = 5
+    assert cache.get("u4pru") == {"features": []}
+    assert cache.get("u4pru", max_age=5) is None
+    clock.now = 10
+    assert cache.get("u4pru") is None
+
+
+def test_cell_cache_reports_every_evicted_cell():
+    clock = FakeClock()
+    evicted = []
+    cache = CellCache(max_entries=2, ttl=10, clock=clock, on_evict=evicted.append)
+    cache.put("a", {})
+    cache.put("b", {})
+    cache.get("a")
+    cache.put("c", {})
+    assert evicted == ["b"]
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert evicted == ["b", "a"]
+
+    cache.clear()
+    assert evicted == ["b", "a", "c"]
@@ -0,0 +1,64 @@
+"""The modules below must import without Home Assistant.
+
+``utils/`` scripts and these tests load them outside Home Assistant, so a
+Home Assistant import in any of them is a regression.
+"""
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "met_alerts"
+
+HA_FREE_MODULES = [
+    "const",
+    "core",
+    "fixtures",
+    "geocell",
+    "interval_index",
+    "providers",
+    "registry",
+    "svg_map",
+    "thresholds",
+]
+
+# Runs in a fresh interpreter where importing homeassistant fails, even if it is installed
+IMPORT_SCRIPT = """
+import importlib
+import sys
+import types
+
+
+class BlockHomeAssistant:
+    def find_spec(self, name, path=None, target=None):
+        if name.partition(".")[0] == "homeassistant":
+            raise ImportError(f"{name} must not be imported")
+
+
+sys.meta_path.insert(0, BlockHomeAssistant())
+package = types.ModuleType("met_alerts")
+package.__path__ = [sys.argv[1]]
+sys.modules["met_alerts"] = package
+importlib.import_module("met_alerts." + sys.argv[2])
+"""
+
+
+@pytest.mark.parametrize("module", HA_FREE_MODULES)
+def test_module_imports_without_home_assistant(module):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, str(PACKAGE_DIR), module],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_blocked_import_is_detected():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, str(PACKAGE_DIR), "coordinator"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "must not be imported" in result.stderr
@@ -0,0 +1,115 @@
+"""Tests for the alert provider pipeline."""
+import asyncio
+import time
+
+import pytest
+
+from met_alerts.providers import AlertPipeline, AlertProvider, ProviderStats, merge_alerts
+
+
+class StaticProvider(AlertProvider):
+    """Provider returning fixed records; ``delay`` simulates a slow source and ``error`` a failing one."""
+
+    def __init__(self, name, alerts, delay=0.0, error=None):
+        self.name = name
+        self.alerts = alerts
+        self.delay = delay
+        self.error = error
+
+    async def async_fetch(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.alerts
+
+
+def record(key, severity_level=2, areas=("Vestland",), source="test"):
+    return {"id": key, "severity_level": severity_level, "areas": list(areas), "source": source}
+
+
+def test_alert_provider_is_abstract():
+    with pytest.raises(TypeError):
+        AlertProvider()
+
+
+def test_providers_are_fetched_concurrently():
+    pipeline = AlertPipeline(
+        [StaticProvider(f"slow{n}", [record(f"a{n}")], delay=0.2) for n in range(3)]
+    )
+    started = time.monotonic()
+    result = asyncio.run(pipeline.async_run())
+    assert time.monotonic() - started < 0.5
+    assert set(result.alerts) == {"a0", "a1", "a2"}
+    assert not result.errors
+
+
+def test_slow_provider_times_out_without_holding_up_others():
+    slow = StaticProvider("slow", [record("late")], delay=5)
+    slow.timeout = 0.05
+    pipeline = AlertPipeline([slow, StaticProvider("fast", [record("on-time")])])
+    started = time.monotonic()
+    result = asyncio.run(pipeline.async_run())
+    assert time.monotonic() - started < 1
+    assert set(result.alerts) == {"on-time"}
+    assert isinstance(result.errors["slow"], TimeoutError)
+    assert "timed out" in result.stats["slow"].error
+    assert result.stats["fast"].error is None
+
+
+def test_timeout_raised_by_provider_keeps_its_message():
+    pipeline = AlertPipeline([StaticProvider("met", [], error=TimeoutError("request timed out after 10s"))])
+    result = asyncio.run(pipeline.async_run())
+    assert result.stats["met"].error == "request timed out after 10s"
+
+
+def test_failing_provider_falls_back_to_last_alerts():
+    flaky = StaticProvider("flaky", [record("kept")])
+    pipeline = AlertPipeline([flaky, StaticProvider("steady", [record("other")])])
+    asyncio.run(pipeline.async_run())
+
+    flaky.error = RuntimeError("boom")
+    result = asyncio.run(pipeline.async_run())
+    assert set(result.alerts) == {"kept", "other"}
+    assert result.stats["flaky"].stale is True
+    assert result.stats["flaky"].error == "boom"
+    assert result.stats["flaky"].alerts == 1
+    assert result.stats["steady"].stale is False
+
+
+def test_failing_provider_without_earlier_alerts_is_not_stale():
+    pipeline = AlertPipeline([StaticProvider("broken", [], error=RuntimeError("down"))])
+    result = asyncio.run(pipeline.async_run())
+    assert result.alerts == {}
+    assert result.stats["broken"].stale is False
+    assert "broken" in result.errors
+
+
+def test_merge_alerts_keeps_most_severe_and_all_areas():
+    merged = merge_alerts(
+        [
+            record("a", 2, ["Vestland"], source="first"),
+            record("a", 3, ["Rogaland"], source="second"),
+            record("a", 2, ["Vestland", "Agder"], source="third"),
+            record("b", 2, ["Troms"]),
+        ]
+    )
+    assert set(merged) == {"a", "b"}
+    assert merged["a"]["source"] == "second"
+    assert merged["a"]["severity_level"] == 3
+    assert merged["a"]["areas"] == ["Vestland", "Rogaland", "Agder"]
+
+
+def test_merge_alerts_reuses_identical_records():
+    alert = record("a")
+    assert merge_alerts([alert, dict(alert)])["a"] is alert
+
+
+def test_provider_stats_as_dict():
+    assert ProviderStats(0.1234, 3).as_dict() == {"latency_ms": 123, "alerts": 3, "error": None, "stale": False}
+    assert ProviderStats(0.5, 1, "boom", True).as_dict() == {
+        "latency_ms": 500,
+        "alerts": 1,
+        "error": "boom",
+        "stale": True,
+    }
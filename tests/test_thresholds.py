@@ -0,0 +1,37 @@
+"""Tests for the threshold binary sensor evaluation."""
+from met_alerts.core import normalize_alert
+from met_alerts.fixtures import TESTVILLE_FIXTURE, load_payload
+from met_alerts.thresholds import evaluate_thresholds, threshold_keys
+
+
+def alert(color, alert_type="gale"):
+    return {"severity_color": color, "alert_type": alert_type}
+
+
+def test_threshold_keys():
+    assert threshold_keys(["orange", "red"], ["gale"]) == ["severity_orange", "severity_red", "event_gale"]
+
+
+def test_severity_thresholds_are_met_by_their_color_or_worse():
+    thresholds = ["yellow", "orange", "red"]
+    assert evaluate_thresholds([alert("orange")], thresholds, []) == {
+        "severity_yellow": True,
+        "severity_orange": True,
+        "severity_red": False,
+    }
+    assert evaluate_thresholds([alert("yellow"), alert("Red")], thresholds, []) == dict.fromkeys(
+        threshold_keys(thresholds, []), True
+    )
+    assert evaluate_thresholds([], thresholds, []) == dict.fromkeys(threshold_keys(thresholds, []), False)
+
+
+def test_event_thresholds():
+    assert evaluate_thresholds([alert("yellow", "rain")], [], ["rain", "gale"]) == {
+        "event_rain": True,
+        "event_gale": False,
+    }
+
+
+def test_testville_alerts_turn_on_orange_and_red():
+    alerts = [normalize_alert(feature) for feature in load_payload(TESTVILLE_FIXTURE)["features"]]
+    assert evaluate_thresholds(alerts, ["orange", "red"], []) == {"severity_orange": True, "severity_red": True}
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Record real MetAlerts responses or generate synthetic ones for replay.
+
+Recordings can be replayed by the integration: set "Replay fixture file"
+in the integration options to the output path (relative to the Home
+Assistant config directory) and choose a replay speed.
+
+Examples:
+    python utils/alert_fixtures.py record --lat 60.39 --lon 5.32 --count 12 --interval 300 -o storm.json
+    python utils/alert_fixtures.py generate --count 500 --seed 1 -o synthetic.json
+"""
+
+import argparse
+from datetime import datetime
+import json
+from pathlib import Path
+import sys
+import time
+import urllib.request
+
+# fixtures.py does not depend on Home Assistant, so import it directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components" / "met_alerts"))
+import fixtures  # noqa: E402
+
+API_URL = "https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0/current.json?lat={lat}&lon={lon}&lang={lang}"
+USER_AGENT = "met_alerts-fixtures https://github.com/kurtern84/met_alerts"
+
+
+def fetch(lat, lon, lang):
+    """Fetch one response from the MetAlerts API"""
+    request = urllib.request.Request(
+        API_URL.format(lat=lat, lon=lon, lang=lang),
+        headers={"User-Agent": USER_AGENT},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)
+
+
+def record(args):
+    """Poll the API and store every response as a frame"""
+    recorder = fixtures.FixtureRecorder(
+        args.output, query={"lat": args.lat, "lon": args.lon, "lang": args.lang}
+    )
+    for i in range(args.count):
+        if i:
+            time.sleep(args.interval)
+        payload = fetch(args.lat, args.lon, args.lang)
+        recorder.record(payload)
+        print(f"Frame {i + 1}/{args.count}: {len(payload.get('features', []))} alert(s)")
+        # Save after every frame so an interrupted recording is still usable
+        recorder.save()
+    print(f"Saved {len(recorder.frames)} frame(s) to {args.output}")
+
+
+def generate(args):
+    """Write a single-frame recording with synthetic alerts"""
+    start = datetime.fromisoformat(args.start) if args.start else None
+    payload = fixtures.generate_alerts(
+        args.count,
+        events=args.events.split(",") if args.events else fixtures.DEFAULT_EVENTS,
+        center=(args.lat, args.lon),
+        spread=args.spread,
+        radius=args.radius,
+        vertices=args.vertices,
+        start=start,
+        window_hours=args.window_hours,
+        seed=args.seed,
+    )
+    recorder = fixtures.FixtureRecorder(args.output, query={"synthetic": True, "seed": args.seed})
+    recorder.record(payload)
+    recorder.save()
+    print(f"Saved {args.count} synthetic alert(s) to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rec = subparsers.add_parser("record", help="Record real API responses")
+    rec.add_argument("--lat", type=float, required=True)
+    rec.add_argument("--lon", type=float, required=True)
+    rec.add_argument("--lang", default="no", choices=["no", "en"])
+    rec.add_argument("--count", type=int, default=1, help="Number of responses to record")
+    rec.add_argument("--interval", type=float, default=1800, help="Seconds between responses")
+    rec.add_argument("-o", "--output", required=True)
+    rec.set_defaults(func=record)
+
+    gen = subparsers.add_parser("generate", help="Generate synthetic alerts")
+    gen.add_argument("--count", type=int, default=10)
+    gen.add_argument("--events", help="Comma separated event types, e.g. gale,rain")
+    gen.add_argument("--lat", type=float, default=60.39, help="Center latitude")
+    gen.add_argument("--lon", type=float, default=5.32, help="Center longitude")
+    gen.add_argument("--spread", type=float, default=2.0, help="Max offset of alert centers in degrees")
+    gen.add_argument("--radius", type=float, default=0.5, help="Polygon radius in degrees")
+    gen.add_argument("--vertices", type=int, default=16, help="Polygon vertex count")
+    gen.add_argument("--start", help="ISO8601 start of the first window (default: now)")
+    gen.add_argument("--window-hours", type=float, default=48, help="Spread of alert onsets")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("-o", "--output", required=True)
+    gen.set_defaults(func=generate)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
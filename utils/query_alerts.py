@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Query MetAlerts through the integration's core module and print timings.
+
+Runs without Home Assistant. Each query fetches the alerts for a location
+(or loads a saved payload with --fixture), normalizes and sorts them, and
+reports how long each step took.
+
+Examples:
+    python utils/query_alerts.py --location 60.39,5.32
+    python utils/query_alerts.py --location 60.39,5.32 --location 59.91,10.75 --repeat 5 --concurrency 4
+    python utils/query_alerts.py --fixture synthetic.json --repeat 100
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import time
+import types
+
+import aiohttp
+
+# Load the integration's modules without running its Home Assistant __init__
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "met_alerts"
+package = types.ModuleType("met_alerts")
+package.__path__ = [str(PACKAGE_DIR)]
+sys.modules["met_alerts"] = package
+from met_alerts import core, fixtures  # noqa: E402
+
+USER_AGENT = "met_alerts-query https://github.com/kurtern84/met_alerts"
+
+
+async def run_query(session, semaphore, latitude, longitude, lang, payload=None):
+    """Run one query and return its timings in milliseconds"""
+    async with semaphore:
+        started = time.perf_counter()
+        if payload is None:
+            payload = await core.async_fetch_alerts(session, latitude, longitude, lang)
+        fetched = time.perf_counter()
+        alerts = [core.normalize_alert(feature) for feature in payload.get("features", [])]
+        normalized = time.perf_counter()
+        core.sort_features(payload.get("features", []))
+        for alert in alerts:
+            core.icon_url(alert["alert_type"], alert["severity_color"])
+        done = time.perf_counter()
+    return {
+        "location": f"{latitude},{longitude}",
+        "alerts": len(alerts),
+        "fetch": (fetched - started) * 1000,
+        "normalize": (normalized - fetched) * 1000,
+        "sort": (done - normalized) * 1000,
+        "total": (done - started) * 1000,
+    }
+
+
+def summarize(results):
+    """Print min, median and max of every timing"""
+    print(f"\n{len(results)} queries")
+    for key in ("fetch", "normalize", "sort", "total"):
+        values = [result[key] for result in results]
+        print(
+            f"  {key:<10} min {min(values):9.2f} ms   median {statistics.median(values):9.2f} ms"
+            f"   max {max(values):9.2f} ms"
+        )
+
+
+async def main_async(args):
+    locations = [tuple(float(value) for value in location.split(",")) for location in args.location]
+    payload = None
+    if args.fixture:
+        payload = fixtures.load_recording(args.fixture)[-1]["payload"]
+        locations = locations or [(0.0, 0.0)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session:
+        queries = [
+            run_query(session, semaphore, latitude, longitude, args.lang, payload)
+            for _ in range(args.repeat)
+            for latitude, longitude in locations
+        ]
+        results = await asyncio.gather(*queries)
+    for result in results:
+        print(
+            f"{result['location']:<20} {result['alerts']:4d} alert(s)  fetch {result['fetch']:9.2f} ms"
+            f"  normalize {result['normalize']:8.2f} ms  sort {result['sort']:8.2f} ms"
+        )
+    summarize(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--location", action="append", default=[], help="LAT,LON to query (repeatable)")
+    parser.add_argument("--lang", default="no", choices=["no", "en"])
+    parser.add_argument("--repeat", type=int, default=1, help="Times to run every query")
+    parser.add_argument("--concurrency", type=int, default=1, help="Queries running at the same time")
+    parser.add_argument("--fixture", help="Use the last frame of a recording instead of the API")
+    args = parser.parse_args()
+    if not args.location and not args.fixture:
+        parser.error("give at least one --location or a --fixture")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()